@@ -148,11 +148,9 @@ def process_vineet_sheet():
         df['api_response'] = None
         df['processed_at'] = None
         
-        # Process each ingredient
-        for index, row in df.iterrows():
-            ingredient_name = row['ingredient_name']
-            source_amount = row['amount']
-            source_unit = row['unit']
+        # Process each ingredient (zipping the input columns avoids building a Series per row)
+        for index, ingredient_name, source_amount, source_unit in zip(df.index, df['ingredient_name'],
+                                                                      df['amount'], df['unit']):
             
             print(f"\nProcessing {index + 1}/{len(df)}: {ingredient_name}")
             print(f"Converting {source_amount} {source_unit} to {target_unit}")
@@ -1,16 +1,24 @@
 import ast
+import atexit
+import io
 import json
 import logging
+import math
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple, Callable
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable
 import threading
 import concurrent.futures
 import random
 import os
 import re
-from urllib.parse import urljoin, urlparse
+import sys
+from urllib.parse import urljoin, urlparse, unquote, parse_qs
+from html import unescape as html_unescape
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from itertools import chain
 
 import pandas as pd
 import requests
@@ -20,6 +28,43 @@ from dotenv import load_dotenv
 import psycopg2
 import psycopg2.extras
 
+# Optional streaming JSON parser for very large embedded JSON-LD graphs
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional lxml fast path for DOM lookups (BeautifulSoup stays as the fallback)
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# soupsieve is what BeautifulSoup's select() runs on; used directly to precompile fallback selectors
+try:
+    import soupsieve
+    SOUPSIEVE_AVAILABLE = True
+except ImportError:
+    SOUPSIEVE_AVAILABLE = False
+
+# Faster JSON parsing for embedded JSON-LD when orjson is installed (accepts str or bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional RE2 engine (google-re2) for the regexes that scan whole untrusted pages in linear time
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Enhanced anti-detection imports
 try:
     import cloudscraper
@@ -183,7 +228,8 @@ PERFORMANCE_CONFIG = {
     'fast_fail_timeout': 10,      # Increased from 3 to 10 seconds
     'zenrows_rate_limit': 1.0,    # Increased from 0.3 to 1.0 second
     'regular_request_delay': 2.0, # Increased from 0.1 to 2.0 seconds
-    'enable_result_caching': True
+    'enable_result_caching': True,
+    'extraction_workers': None    # Process pool size for batch page extraction (None = os.cpu_count())
 }
 
 # Session-level result cache to avoid re-scraping the same URLs
@@ -4836,10 +4882,7 @@ def process_row_with_priority_system(prices_dict: Dict[str, Any], fetcher) -> Di
             
             # Parse HTML
             from bs4 import BeautifulSoup
-            try:
-                soup = BeautifulSoup(html, 'lxml')
-            except:
-                soup = BeautifulSoup(html, 'html.parser')
+            soup = _page_soup(html, store_norm)
             
             # Extract breadcrumbs
             crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store_norm)
@@ -4898,10 +4941,7 @@ def process_row_with_priority_system(prices_dict: Dict[str, Any], fetcher) -> Di
             # Attempt ZenRows for this blocked store
             html = fetcher.fetch_with_zenrows(url, store_norm)
             if html and len(html) > 500:
-                try:
-                    soup = BeautifulSoup(html, 'lxml')
-                except:
-                    soup = BeautifulSoup(html, 'html.parser')
+                soup = _page_soup(html, store_norm)
                 
                 crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store_norm)
                 if crumbs:
@@ -5042,10 +5082,7 @@ def attempt_single_store_scraping(url: str, store_name: str, fetcher) -> Dict[st
                 html = html or ""  # Ensure html is a string
         
         # Parse HTML
-        try:
-            soup = BeautifulSoup(html, 'lxml')
-        except:
-            soup = BeautifulSoup(html, 'html.parser')
+        soup = _page_soup(html, store_norm)
         
         # Extract breadcrumbs
         crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store_norm)
@@ -5082,6 +5119,36 @@ def attempt_single_store_scraping(url: str, store_name: str, fetcher) -> Dict[st
             'debug': f'Exception: {str(e)[:200]}'
         }
 
+# ------------------------------------------------------------------
+# BATCH PAGE EXTRACTION
+# ------------------------------------------------------------------
+
+def _extract_page_breadcrumbs(page: Tuple[str, str, str]) -> Tuple[List[str], str]:
+    """Parse one fetched (html, url, store_norm) page and extract its breadcrumbs.
+    
+    Top-level so worker processes can run it: only the HTML string is pickled, while the
+    compiled patterns and selector tables are module globals each worker already has.
+    """
+    html, url, store_norm = page
+    try:
+        soup = _page_soup(html, store_norm)
+        crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store_norm)
+        return normalize_breadcrumbs(crumbs, store_norm, url), debug
+    except Exception as e:
+        logger.debug(f"Batch extraction failed for {url}: {e}")
+        return [], f'Exception: {str(e)[:200]}'
+
+def extract_breadcrumbs_from_pages(pages: Iterable[Tuple[str, str, str]], max_workers: Optional[int] = None,
+                                   chunksize: int = 16) -> List[Tuple[List[str], str]]:
+    """Extract breadcrumbs from already-fetched pages, spreading the CPU-bound parsing over processes."""
+    pages = list(pages)
+    workers = max_workers or PERFORMANCE_CONFIG.get('extraction_workers') or os.cpu_count() or 1
+    if workers <= 1 or len(pages) < 2:
+        return [_extract_page_breadcrumbs(page) for page in pages]
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(pages))) as executor:
+        return list(executor.map(_extract_page_breadcrumbs, pages, chunksize=chunksize))
+
 # ------------------------------------------------------------------
 # MAIN EXECUTION FUNCTIONS
 # ------------------------------------------------------------------
@@ -5463,10 +5530,7 @@ def extract_aisles_from_all_stores(prices_dict: Dict[str, Any], fetcher) -> Dict
             
             # Parse HTML
             from bs4 import BeautifulSoup
-            try:
-                soup = BeautifulSoup(html, 'lxml')
-            except:
-                soup = BeautifulSoup(html, 'html.parser')
+            soup = _page_soup(html, store_norm)
             
             # Extract breadcrumbs using the enhanced extraction function
             crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store_norm)
@@ -5672,10 +5736,7 @@ def test_store_specific_scrapers():
                 continue
             
             # Parse HTML
-            try:
-                soup = BeautifulSoup(html, 'lxml')
-            except:
-                soup = BeautifulSoup(html, 'html.parser')
+            soup = _page_soup(html, store)
             
             # Extract breadcrumbs
             crumbs, debug = extract_breadcrumbs_enhanced(soup, html, url, store)
@@ -9055,7 +9116,7 @@ def scrape_asda_enhanced(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
                             if match_content.startswith('['):
                                 # Try to parse as JSON array
                                 try:
-                                    breadcrumb_data = json.loads(match_content)
+                                    breadcrumb_data = _json_loads(match_content)
                                     if isinstance(breadcrumb_data, list) and breadcrumb_data:
                                         for item in breadcrumb_data:
                                             if isinstance(item, dict) and 'name' in item:
@@ -9103,7 +9164,7 @@ def scrape_asda_enhanced(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
             for match in matches:
                 try:
                     state_json = match.group(1)
-                    state_data = json.loads(state_json)
+                    state_data = _json_loads(state_json)
                     breadcrumbs = _extract_from_state_data(state_data)
                     if breadcrumbs:
                         logger.debug(f"✅ ASDA Window State: {breadcrumbs}")
@@ -10070,16 +10131,15 @@ def infer_morrisons_category_from_product_name(product_name: str) -> List[str]:
     
     return []
 
-def scrape_morrisons_with_selenium(url: str) -> List[str]:
-    """
-    Selenium-based Morrisons breadcrumb extraction for dynamically rendered content.
-    This is the most accurate method for Morrisons since they use client-side rendering.
-    """
-    if not ADVANCED_TOOLS_AVAILABLE:
-        return []
-    
-    driver = None
-    try:
+class _MorrisonsDriverPool:
+    """Keeps one headless Chrome per thread alive across Morrisons Selenium extractions."""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.drivers = []
+
+    def _create_driver(self):
         # Setup Chrome with stealth settings
         options = uc.ChromeOptions()
         options.add_argument("--headless=new")
@@ -10090,6 +10150,71 @@ def scrape_morrisons_with_selenium(url: str) -> List[str]:
         options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
         driver = uc.Chrome(options=options, version_main=None)
+        with self.lock:
+            self.drivers.append(driver)
+        return driver
+
+    def get_driver(self):
+        """Return this thread's driver, recreating it if the browser session has died."""
+        driver = getattr(self.local, 'driver', None)
+        if driver is not None:
+            try:
+                if driver.session_id:
+                    driver.current_url  # Cheap liveness probe
+                    return driver
+            except Exception:
+                pass
+            self.discard(driver)
+        
+        driver = self._create_driver()
+        self.local.driver = driver
+        return driver
+
+    def reset(self, driver):
+        """Clear per-page state so the next extraction starts from a blank session."""
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception:
+            self.discard(driver)
+
+    def discard(self, driver):
+        """Quit a broken driver and forget it."""
+        if getattr(self.local, 'driver', None) is driver:
+            self.local.driver = None
+        with self.lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except:
+            pass
+
+    def close_all(self):
+        """Quit every driver created by the pool (registered with atexit)."""
+        with self.lock:
+            drivers, self.drivers = self.drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+
+_MORRISONS_DRIVER_POOL = _MorrisonsDriverPool()
+atexit.register(_MORRISONS_DRIVER_POOL.close_all)
+
+def scrape_morrisons_with_selenium(url: str) -> List[str]:
+    """
+    Selenium-based Morrisons breadcrumb extraction for dynamically rendered content.
+    This is the most accurate method for Morrisons since they use client-side rendering.
+    The browser is reused across calls (see _MorrisonsDriverPool) instead of relaunched per URL.
+    """
+    if not ADVANCED_TOOLS_AVAILABLE:
+        return []
+    
+    driver = None
+    try:
+        driver = _MORRISONS_DRIVER_POOL.get_driver()
         
         # Navigate to URL
         driver.get(url)
@@ -10121,11 +10246,14 @@ def scrape_morrisons_with_selenium(url: str) -> List[str]:
                     if element.is_displayed():  # Must be visible
                         breadcrumb_text = element.text.strip()
                         if breadcrumb_text and len(breadcrumb_text) > 10:
-                            # Extract individual breadcrumb items
-                            items = element.find_elements(By.CSS_SELECTOR, "a, span, li")
+                            # Extract individual breadcrumb items in a single driver round-trip
+                            items = driver.execute_script(
+                                "return Array.from(arguments[0].querySelectorAll('a, span, li'))"
+                                ".map(e => (e.innerText || '').trim());",
+                                element,
+                            ) or []
                             breadcrumbs = []
-                            for item in items:
-                                text = item.text.strip()
+                            for text in items:
                                 if (text and len(text) > 0 and 
                                     text.lower() not in {'morrisons', 'morrisons online groceries & offers'} and
                                     not text.lower().startswith(('skip to', 'view all'))):
@@ -10232,86 +10360,335 @@ def scrape_morrisons_with_selenium(url: str) -> List[str]:
         return []
     finally:
         if driver:
+            _MORRISONS_DRIVER_POOL.reset(driver)
+
+# ------------------------------------------------------------------
+# LXML FAST-PATH HELPERS
+# ------------------------------------------------------------------
+
+def _xpath(expression: str):
+    """Compile an XPath once at import time, or return None when lxml is unavailable."""
+    return etree.XPath(expression) if LXML_AVAILABLE else None
+
+def _css_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector '.name'."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_XPATH_TEXT_NODES = _xpath('.//text()')
+_XPATH_DESCENDANT_LINKS = _xpath('.//a')
+_XPATH_FIRST_TITLE = _xpath('(//title)[1]')
+_XPATH_JSONLD_TEXTS = _xpath("//script[@type='application/ld+json']/text()")
+_XPATH_ALL_SCRIPTS = _xpath('//script')
+
+# Stores whose extractors run entirely on the shared lxml tree when lxml is installed
+_LXML_NATIVE_STORES = frozenset({'amazon', 'poundland', 'savers'})
+
+class _LazySoup:
+    """Stand-in for a BeautifulSoup document that only parses the page on first use."""
+
+    __slots__ = ('_html', '_soup')
+
+    def __init__(self, html: str):
+        self._html = html
+        self._soup = None
+
+    def _parsed(self) -> BeautifulSoup:
+        if self._soup is None:
             try:
-                driver.quit()
-            except:
-                pass
+                self._soup = BeautifulSoup(self._html, 'lxml')
+            except Exception:
+                self._soup = BeautifulSoup(self._html, 'html.parser')
+        return self._soup
+
+    def __getattr__(self, name):
+        return getattr(self._parsed(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._parsed()(*args, **kwargs)
+
+    def __str__(self) -> str:
+        return str(self._parsed())
+
+def _page_soup(html: str, store_norm: str):
+    """
+    Build the BeautifulSoup document handed to extract_breadcrumbs_enhanced().
+
+    For stores in _LXML_NATIVE_STORES the BeautifulSoup parse is deferred, since their
+    extractors only touch the soup if the lxml fast path is unavailable for the page.
+    """
+    if LXML_AVAILABLE and store_norm in _LXML_NATIVE_STORES:
+        return _LazySoup(html)
+    try:
+        return BeautifulSoup(html, 'lxml')
+    except Exception:
+        return BeautifulSoup(html, 'html.parser')
+
+# Last parsed page per worker thread, so every scraper run on the same HTML shares one lxml parse
+_LXML_PAGE_CACHE = threading.local()
+
+def _lxml_tree(html: str):
+    """Parse HTML into an lxml tree, or return None so callers fall back to BeautifulSoup.
+    
+    The most recent parse is cached per thread and reused when the same html string is passed
+    again (store scraper, generic fallback and re-runs all receive the same object).
+    """
+    if not LXML_AVAILABLE or not html:
+        return None
+    if getattr(_LXML_PAGE_CACHE, 'html', None) is html:
+        return _LXML_PAGE_CACHE.tree
+    try:
+        tree = lxml_html.fromstring(html)
+    except Exception as e:
+        logger.debug(f"lxml parse failed, falling back to BeautifulSoup: {e}")
+        tree = None
+    _LXML_PAGE_CACHE.html = html
+    _LXML_PAGE_CACHE.tree = tree
+    return tree
+
+def _page_title(soup: BeautifulSoup, tree) -> Optional[str]:
+    """Text of the first <title> when it is a single text node (BeautifulSoup's title.string)."""
+    if tree is not None:
+        titles = _XPATH_FIRST_TITLE(tree)
+        if titles and len(titles[0]) == 0:
+            return titles[0].text
+        return None
+    title_tag = soup.find('title') if soup else None
+    return title_tag.string if title_tag else None
+
+@lru_cache(maxsize=256)
+def _compiled_css(selector: str):
+    """Compile a CSS selector with soupsieve once per process."""
+    return soupsieve.compile(selector)
+
+def _css_select(soup: BeautifulSoup, selector: str) -> List[Any]:
+    """soup.select(selector) for the BeautifulSoup fallback, matching with a precompiled selector."""
+    if isinstance(soup, _LazySoup):
+        soup = soup._parsed()
+    if SOUPSIEVE_AVAILABLE:
+        return _compiled_css(selector).select(soup)
+    return soup.select(selector)
+
+def _node_text(node) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for both bs4 tags and lxml elements."""
+    if hasattr(node, 'get_text'):
+        return node.get_text(strip=True)
+    return ''.join(text.strip() for text in _XPATH_TEXT_NODES(node))
+
+# ------------------------------------------------------------------
+# PAGE RESULT CACHE
+# ------------------------------------------------------------------
+
+_PAGE_RESULT_CACHE_SIZE = 1024
+
+def _memoize_page_result(func: Callable) -> Callable:
+    """
+    Cache a scraper's (breadcrumbs, method) result per page.
+
+    The key is (hash(html), len(html), url), computed once per call, so revisited pages
+    (pagination, variant URLs, retries) skip all DOM, JSON-LD and regex work. Only the
+    result is stored, never the soup or HTML. The cache is an LRU shared by all worker
+    threads and guarded by a lock; callers get a fresh list on every hit.
+    """
+    cache = OrderedDict()  # (hash, len, url) -> (breadcrumbs tuple, method)
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(soup: BeautifulSoup, html: str, url: str = "") -> Tuple[List[str], str]:
+        page = html or ''
+        key = (hash(page), len(page), url)
+        with lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+
+        breadcrumbs, method = func(soup, html, url)
+        with lock:
+            cache[key] = (tuple(breadcrumbs), method)
+            if len(cache) > _PAGE_RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return breadcrumbs, method
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 # ------------------------------------------------------------------
 # B&M STORES SCRAPER IMPLEMENTATION
 # ------------------------------------------------------------------
 
+def _safe_position(item: Any) -> int:
+    """Sort key for JSON-LD ListItems that tolerates missing or malformed positions."""
+    if not isinstance(item, dict):
+        return 0
+    position = item.get('position', 0)
+    if isinstance(position, bool):
+        return 0
+    if isinstance(position, int):
+        return position
+    if isinstance(position, float):
+        # The stdlib json fallback parses NaN/Infinity/1e400 into floats int() cannot convert
+        return int(position) if math.isfinite(position) else 0
+    if isinstance(position, str) and position.strip().isdigit():
+        return int(position)
+    return 0
+
+def _script_text(script) -> Optional[str]:
+    """Return a script tag's raw text, reading the single child node directly when possible."""
+    contents = script.contents
+    if not contents:
+        return None
+    if len(contents) == 1:
+        return str(contents[0])
+    return "".join(script.strings)
+
+# JSON-LD blobs above this size are stream-parsed, keeping only the keys the extractors read
+_JSONLD_STREAM_THRESHOLD = 64_000
+_JSONLD_STREAM_KEYS = frozenset({'@type', 'name', 'category', 'itemListElement'})
+
+def _stream_jsonld_candidates(text: str) -> Tuple[Any, ...]:
+    """Stream-parse a large JSON-LD blob with ijson, materializing only _JSONLD_STREAM_KEYS
+    of each top-level object (everything else, e.g. offers/reviews, is never built)."""
+    candidates = []
+    current = None
+    object_prefix = None
+    builder = None
+    builder_key = None
+    builder_depth = 0
+    
+    for prefix, event, value in ijson.parse(io.BytesIO(text.encode('utf-8'))):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                builder_depth += 1
+            elif event in ('end_map', 'end_array'):
+                builder_depth -= 1
+            if builder_depth == 0:
+                current[builder_key] = builder.value
+                builder = None
+            continue
+        
+        if event == 'start_map' and prefix in ('', 'item') and current is None:
+            current = {}
+            object_prefix = prefix
+        elif event == 'end_map' and current is not None and prefix == object_prefix:
+            candidates.append(current)
+            current = None
+        elif event == 'map_key' and current is not None and prefix == object_prefix and value in _JSONLD_STREAM_KEYS:
+            builder = ObjectBuilder()
+            builder_key = value
+            builder_depth = 0
+    
+    return tuple(candidates)
+
+# Parsed JSON-LD blobs kept across pages; sized for a category's worth of repeated breadcrumbs
+_JSONLD_PARSE_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=_JSONLD_PARSE_CACHE_SIZE)
+def _parse_jsonld_text(text: str) -> Tuple[Any, ...]:
+    """Parse one JSON-LD blob into its top-level candidates.
+    
+    Cached on the raw text, so scrapers sharing a page parse it once and pages that embed the
+    same BreadcrumbList (products in one category) reuse the earlier parse. Callers must treat
+    the returned objects as read-only.
+    """
+    if IJSON_AVAILABLE and len(text) > _JSONLD_STREAM_THRESHOLD:
+        try:
+            return _stream_jsonld_candidates(text)
+        except Exception as e:
+            logger.debug(f"Streaming JSON-LD parse failed: {e}")
+            return ()
+    try:
+        data = _json_loads(text)
+    except ValueError:
+        return ()
+    return tuple(data) if isinstance(data, list) else (data,)
+
+def _jsonld_objects(soup: BeautifulSoup, tree=None, markers: Tuple[str, ...] = ()) -> List[Any]:
+    """Return the top-level objects of every JSON-LD script on the page, in document order.
+    
+    When a shared lxml tree is available the raw script texts come from one compiled XPath.
+    If markers are given, scripts whose raw text contains none of them (e.g. a 'BreadcrumbList'
+    @type) are skipped without being parsed.
+    """
+    if tree is not None:
+        texts = [str(text) for text in _XPATH_JSONLD_TEXTS(tree)]
+    elif soup:
+        texts = [_script_text(script) for script in soup.find_all('script', type='application/ld+json')]
+    else:
+        return []
+    objects = []
+    for text in texts:
+        if text and (not markers or any(marker in text for marker in markers)):
+            objects.extend(_parse_jsonld_text(text))
+    return objects
+
+# B&M and eBay only read BreadcrumbList JSON-LD, so other scripts are skipped unparsed
+_BREADCRUMB_LD_MARKERS = ('BreadcrumbList',)
+
+# Navigation prefixes that disqualify a B&M breadcrumb (anchored, one regex scan per candidate)
+_BMSTORES_JSONLD_SKIP_PREFIX_RE = re.compile(r'(?:back|view all|see all|show more)')
+_BMSTORES_DOM_SKIP_PREFIX_RE = re.compile(r'(?:back to|shop |browse |view all|see all|show more)')
+
+# DOM selectors for B&M breadcrumb links, tried in order
+_BMSTORES_BREADCRUMB_SELECTORS = (
+    # B&M uses nav with aria-label breadcrumb based on our test
+    "nav[aria-label*='breadcrumb' i] a",
+    "nav[aria-label*='Breadcrumb' i] a", 
+    ".breadcrumb a",
+    ".breadcrumbs a",
+    "ol.breadcrumb a",
+    "ul.breadcrumb a",
+    ".breadcrumb-list a",
+    ".navigation-breadcrumb a",
+    ".product-breadcrumb a",
+    ".page-breadcrumb a",
+    
+    # Test ID patterns
+    "[data-testid*='breadcrumb'] a",
+    "[data-testid*='navigation'] a",
+    "[data-test*='breadcrumb'] a",
+    
+    # Microdata patterns
+    "[itemtype*='BreadcrumbList'] a",
+    "[itemscope][itemtype*='breadcrumb'] a",
+)
+
 def scrape_bmstores_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple[List[str], str]:
     """Enhanced B&M Stores breadcrumb extractor with JSON-LD and DOM methods."""
     
-    # Method 1: JSON-LD BreadcrumbList extraction
+    # Method 1: JSON-LD BreadcrumbList extraction (only scripts that declare a BreadcrumbList)
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
-                    
-                    for obj in candidates:
-                        if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
-                            items = obj.get('itemListElement', [])
-                            breadcrumbs = []
-                            
-                            # Sort by position if available
-                            try:
-                                sorted_items = sorted(items, key=lambda x: x.get('position', 0))
-                            except:
-                                sorted_items = items
-                            
-                            for item in sorted_items:
-                                if isinstance(item, dict):
-                                    name = item.get('name')
-                                    if not name and isinstance(item.get('item'), dict):
-                                        name = item['item'].get('name')
-                                    
-                                    if name and isinstance(name, str) and len(name) > 1:
-                                        clean_name = name.strip()
-                                        # Skip store name and navigation elements
-                                        if (clean_name.lower() not in {'b&m', 'bm', 'b&m stores', 'home', 'homepage', 'show more'} and
-                                            not clean_name.lower().startswith(('back', 'view all', 'see all', 'show more'))):
-                                            breadcrumbs.append(clean_name)
-                            
-                            if breadcrumbs:
-                                return breadcrumbs, "bmstores_json_ld_breadcrumb"
+        for obj in _jsonld_objects(soup, markers=_BREADCRUMB_LD_MARKERS):
+            if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
+                items = obj.get('itemListElement', [])
+                breadcrumbs = []
                 
-                except json.JSONDecodeError:
-                    continue
+                # Sort by position if available
+                sorted_items = sorted(items, key=_safe_position)
+                
+                for item in sorted_items:
+                    if isinstance(item, dict):
+                        name = item.get('name')
+                        if not name and isinstance(item.get('item'), dict):
+                            name = item['item'].get('name')
+                        
+                        if name and isinstance(name, str) and len(name) > 1:
+                            clean_name = name.strip()
+                            # Skip store name and navigation elements
+                            if (clean_name.lower() not in {'b&m', 'bm', 'b&m stores', 'home', 'homepage', 'show more'} and
+                                not _BMSTORES_JSONLD_SKIP_PREFIX_RE.match(clean_name.lower())):
+                                breadcrumbs.append(clean_name)
+                
+                if breadcrumbs:
+                    return breadcrumbs, "bmstores_json_ld_breadcrumb"
     
     except Exception as e:
         logger.debug(f"B&M JSON-LD extraction failed: {e}")
     
     # Method 2: DOM breadcrumb extraction
     try:
-        breadcrumb_selectors = [
-            # B&M uses nav with aria-label breadcrumb based on our test
-            "nav[aria-label*='breadcrumb' i] a",
-            "nav[aria-label*='Breadcrumb' i] a", 
-            ".breadcrumb a",
-            ".breadcrumbs a",
-            "ol.breadcrumb a",
-            "ul.breadcrumb a",
-            ".breadcrumb-list a",
-            ".navigation-breadcrumb a",
-            ".product-breadcrumb a",
-            ".page-breadcrumb a",
-            
-            # Test ID patterns
-            "[data-testid*='breadcrumb'] a",
-            "[data-testid*='navigation'] a",
-            "[data-test*='breadcrumb'] a",
-            
-            # Microdata patterns
-            "[itemtype*='BreadcrumbList'] a",
-            "[itemscope][itemtype*='breadcrumb'] a",
-        ]
-        
-        for selector in breadcrumb_selectors:
+        for selector in _BMSTORES_BREADCRUMB_SELECTORS:
             try:
                 elements = soup.select(selector)
                 if elements:
@@ -10329,7 +10706,7 @@ def scrape_bmstores_improved(soup: BeautifulSoup, html: str, url: str = "") -> T
                                 'help', 'contact', 'offers', 'delivery', 'menu',
                                 'skip to content', 'skip to navigation'
                             } and
-                            not text.lower().startswith(('back to', 'shop ', 'browse ', 'view all', 'see all', 'show more')) and
+                            not _BMSTORES_DOM_SKIP_PREFIX_RE.match(text.lower()) and
                             not re.search(r'\b(£|\d+\.\d+|free|save|offer|deal|%|off)\b', text.lower()) and
                             not re.search(r'^\d+$', text)):
                             
@@ -10368,6 +10745,49 @@ def scrape_bmstores_improved(soup: BeautifulSoup, html: str, url: str = "") -> T
 # EBAY SCRAPER IMPLEMENTATION (6-LEVEL SUPPORT)
 # ------------------------------------------------------------------
 
+# Title sources for eBay product-title inference, combined so the HTML is scanned once
+_EBAY_TITLE_RE = re.compile(
+    r'<title>(?P<t>[^<]+)</title>'
+    r'|property="og:title"\s+content="(?P<og>[^"]+)"'
+    r'|name="twitter:title"\s+content="(?P<tw>[^"]+)"',
+    re.IGNORECASE,
+)
+_EBAY_COLLECTABLES_RE = re.compile(r'collectables', re.IGNORECASE)
+_EBAY_DOLLS_RE = re.compile(r'dolls', re.IGNORECASE)
+
+# Navigation prefixes that disqualify an eBay breadcrumb (anchored via .match)
+_EBAY_SKIP_PREFIX_RE = re.compile(r'(?:back to|see all|view all)')
+_EBAY_DOM_SKIP_PREFIX_RE = re.compile(r'(?:back to|see all|more in|shop by|view all)')
+
+# DOM selectors for eBay breadcrumb/category links, tried in order
+_EBAY_BREADCRUMB_SELECTORS = (
+    # Standard breadcrumb navigation
+    "nav[aria-label*='breadcrumb' i] a",
+    "nav[aria-label*='You are here' i] a",
+    "[role='navigation'] a",
+    ".breadcrumbs a",
+    ".breadcrumb a",
+    "ol.breadcrumb li a",
+    "ul.breadcrumb li a",
+    
+    # eBay-specific patterns
+    "#vi-acc-del-range a",
+    ".u-flL a",
+    ".hl-cat-nav a",
+    "#x-refine-railsplitter a",
+    ".notranslate a",
+    
+    # Category navigation links
+    "a[href*='/sch/']",
+    "a[href*='/b/']", 
+    "a[href*='_cat=']",
+    
+    # Try all navigation links and filter later
+    "nav a",
+    "[class*='nav'] a",
+    "[id*='nav'] a"
+)
+
 def _is_ebay_bot_interception_page(html: str, soup: BeautifulSoup) -> bool:
     """Detect if eBay returned anti-bot interception page."""
     if not html or not soup:
@@ -10397,44 +10817,32 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
         return [], "ebay_empty_html"
     
     # Method 1: JSON-LD BreadcrumbList extraction (PRIMARY - most reliable)
+    # Only scripts that declare a BreadcrumbList are parsed; pages without one skip straight to the DOM methods
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
-                    
-                    for obj in candidates:
-                        if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
-                            items = obj.get('itemListElement', [])
-                            breadcrumbs = []
-                            
-                            # Sort by position if available
-                            try:
-                                sorted_items = sorted(items, key=lambda x: x.get('position', 0))
-                            except:
-                                sorted_items = items
-                            
-                            for item in sorted_items:
-                                if isinstance(item, dict):
-                                    name = item.get('name')
-                                    if not name and isinstance(item.get('item'), dict):
-                                        name = item['item'].get('name')
-                                    
-                                    if name and isinstance(name, str) and len(name) > 1:
-                                        clean_name = name.strip()
-                                        # Skip eBay and homepage elements
-                                        if (clean_name.lower() not in {'ebay', 'home', 'homepage'} and
-                                            not clean_name.lower().startswith(('back to', 'see all', 'view all'))):
-                                            breadcrumbs.append(clean_name)
-                            
-                            if breadcrumbs and len(breadcrumbs) >= 1:  # Accept even single level
-                                logger.info(f"eBay: Extracted from JSON-LD: {breadcrumbs}")
-                                return breadcrumbs[:6], "ebay_json_ld_breadcrumb"
+        for obj in _jsonld_objects(soup, markers=_BREADCRUMB_LD_MARKERS):
+            if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
+                items = obj.get('itemListElement', [])
+                breadcrumbs = []
                 
-                except json.JSONDecodeError:
-                    continue
+                # Sort by position if available
+                sorted_items = sorted(items, key=_safe_position)
+                
+                for item in sorted_items:
+                    if isinstance(item, dict):
+                        name = item.get('name')
+                        if not name and isinstance(item.get('item'), dict):
+                            name = item['item'].get('name')
+                        
+                        if name and isinstance(name, str) and len(name) > 1:
+                            clean_name = name.strip()
+                            # Skip eBay and homepage elements
+                            if (clean_name.lower() not in {'ebay', 'home', 'homepage'} and
+                                not _EBAY_SKIP_PREFIX_RE.match(clean_name.lower())):
+                                breadcrumbs.append(clean_name)
+                
+                if breadcrumbs and len(breadcrumbs) >= 1:  # Accept even single level
+                    logger.info(f"eBay: Extracted from JSON-LD: {breadcrumbs}")
+                    return breadcrumbs[:6], "ebay_json_ld_breadcrumb"
     except Exception as e:
         logger.debug(f"eBay JSON-LD extraction failed: {e}")
     
@@ -10451,7 +10859,7 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
                     text = link.get_text(strip=True)
                     if (text and len(text) > 1 and len(text) < 100 and 
                         text.lower() not in {'ebay', 'home', 'back', 'homepage'} and
-                        not text.lower().startswith(('back to', 'see all', 'view all'))):
+                        not _EBAY_SKIP_PREFIX_RE.match(text.lower())):
                         breadcrumbs.append(text)
                 
                 if len(breadcrumbs) >= 2:
@@ -10463,36 +10871,7 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
     
     # Method 3: Enhanced DOM breadcrumb extraction
     try:
-        # Comprehensive eBay breadcrumb selectors
-        breadcrumb_selectors = [
-            # Standard breadcrumb navigation
-            "nav[aria-label*='breadcrumb' i] a",
-            "nav[aria-label*='You are here' i] a",
-            "[role='navigation'] a",
-            ".breadcrumbs a",
-            ".breadcrumb a",
-            "ol.breadcrumb li a",
-            "ul.breadcrumb li a",
-            
-            # eBay-specific patterns
-            "#vi-acc-del-range a",
-            ".u-flL a",
-            ".hl-cat-nav a",
-            "#x-refine-railsplitter a",
-            ".notranslate a",
-            
-            # Category navigation links
-            "a[href*='/sch/']",
-            "a[href*='/b/']", 
-            "a[href*='_cat=']",
-            
-            # Try all navigation links and filter later
-            "nav a",
-            "[class*='nav'] a",
-            "[id*='nav'] a"
-        ]
-        
-        for selector in breadcrumb_selectors:
+        for selector in _EBAY_BREADCRUMB_SELECTORS:
             try:
                 elements = soup.select(selector)
                 if elements:
@@ -10508,7 +10887,7 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
                                 'daily deals', 'gift cards', 'advanced search', 'watch list',
                                 'sign in', 'register', 'basket', 'checkout', 'account'
                             } and
-                            not text.lower().startswith(('back to', 'see all', 'more in', 'shop by', 'view all')) and
+                            not _EBAY_DOM_SKIP_PREFIX_RE.match(text.lower()) and
                             not re.search(r'\b(£|\$|\d+\.\d+|free|shipping|postage|delivery)\b', text.lower()) and
                             # Must have a valid href (not just #)
                             href and href not in ['#', 'javascript:void(0)', 'javascript:']):
@@ -10538,22 +10917,14 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
     
     # Method 5: Product title inference (FALLBACK ONLY)
     try:
-        # Look for product title and infer category from context
-        title_patterns = [
-            r'<title>([^<]+)</title>',
-            r'property="og:title"\s+content="([^"]+)"',
-            r'name="twitter:title"\s+content="([^"]+)"'
-        ]
-        
+        # Look for product title and infer category from context (single pass over the HTML)
         product_title = ""
-        for pattern in title_patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE)
-            if matches:
-                product_title = matches[0].strip()
-                # Clean up the title (remove eBay suffix)
-                if ' | eBay' in product_title:
-                    product_title = product_title.split(' | eBay')[0]
-                break
+        title_match = _EBAY_TITLE_RE.search(html)
+        if title_match:
+            product_title = (title_match.group('t') or title_match.group('og') or title_match.group('tw')).strip()
+            # Clean up the title (remove eBay suffix)
+            if ' | eBay' in product_title:
+                product_title = product_title.split(' | eBay')[0]
         
         if product_title:
             logger.debug(f"eBay: Found product title: {product_title}")
@@ -10571,12 +10942,9 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
     # Method 6: Look for category patterns in visible text content
     try:
         if soup:
-            # Extract all visible text and look for category patterns
-            visible_text = soup.get_text(separator=' ', strip=True)
-            
-            # Look for collectables/dolls patterns in content
-            text_lower = visible_text.lower()
-            if 'collectables' in text_lower and 'dolls' in text_lower:
+            # Look for collectables/dolls patterns directly in the HTML rather than
+            # building the full visible-text string of the document
+            if _EBAY_COLLECTABLES_RE.search(html) and _EBAY_DOLLS_RE.search(html):
                 logger.info(f"eBay: Found collectables+dolls in content")
                 return ['Collectables & Art', 'Dolls & Bears'], "ebay_content_inference"
     
@@ -10592,6 +10960,137 @@ def scrape_ebay_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple
 # AMAZON SCRAPER IMPLEMENTATION (6-LEVEL SUPPORT)
 # ------------------------------------------------------------------
 
+# Navigation/promotional prefixes skipped in Amazon DOM breadcrumbs (anchored via .match)
+_AMAZON_SKIP_PREFIX_RE = re.compile(
+    r'(?:back |see all|view all|show more|shop |browse |hello,|currently|get it by)'
+)
+
+# Category extraction patterns for Amazon Method 5 (raw HTML) and Method 6 (page text).
+# Each pattern is paired with a lowercase literal it cannot match without, so patterns whose
+# literal is absent from the page are skipped instead of costing a full regex pass.
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.DOTALL, 's'), (re.MULTILINE, 'm'))
+
+def _compile_untrusted(pattern: str, flags: int = 0):
+    """
+    Compile a pattern that is run over whole raw pages.
+
+    Uses RE2 (linear time, no catastrophic backtracking) when google-re2 is installed, and
+    falls back to re when it is not or when the pattern uses syntax RE2 lacks.
+    """
+    if RE2_AVAILABLE:
+        inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+# 'Category > Subcategory' hierarchies, built from one shared category-name fragment. Under re the
+# raw-HTML form starts with (?<![A-Z]) so the engine rejects mid-word start positions immediately
+# instead of re-matching the rest of every word; a match can only start where a letter run starts
+# anyway, so the results are unchanged. RE2 has no lookbehind and does not backtrack, so it gets
+# the bare pattern. The page-text form is already anchored by \b.
+_AMAZON_CATEGORY_NAME = r'[A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*'
+_AMAZON_HIERARCHY_STRUCT = ('' if RE2_AVAILABLE else r'(?<![A-Z])') + rf'({_AMAZON_CATEGORY_NAME}(?:\s+[A-Z][a-z]+)*)\s*[>›]\s*({_AMAZON_CATEGORY_NAME})'
+_AMAZON_HIERARCHY_TEXT = (
+    rf'\b({_AMAZON_CATEGORY_NAME}(?:\s+[A-Z][a-z]+)*)\s*[>›]\s*({_AMAZON_CATEGORY_NAME}(?:\s+[A-Z][a-z]+)*)'
+)
+
+_AMAZON_STRUCT_PATTERNS = [
+    (literal, _compile_untrusted(pattern, re.IGNORECASE | re.DOTALL)) for literal, pattern in (
+        # Department/category data attributes
+        ('data-department', r'data-department="([^"]+)"'),
+        ('data-category', r'data-category="([^"]+)"'),
+        ('data-csa-c-department-id', r'data-csa-c-department-id="([^"]+)"'),
+        
+        # JSON data patterns
+        ('"department"', r'"department"\s*:\s*"([^"]+)"'),
+        ('"categoryname"', r'"categoryName"\s*:\s*"([^"]+)"'),
+        ('"category"', r'"category"\s*:\s*"([^"]+)"'),
+        ('"departmentname"', r'"departmentName"\s*:\s*"([^"]+)"'),
+        
+        # Breadcrumb patterns in various formats
+        ('breadcrumb', r'breadcrumb[^>]*>([^<]+)<'),
+        ('breadcrumb', r'class="[^"]*breadcrumb[^"]*"[^>]*>([^<]+)<'),
+        
+        # Category hierarchy patterns
+        ('', _AMAZON_HIERARCHY_STRUCT),
+        
+        # Amazon specific navigation patterns
+        ('browse', r'<a[^>]+href="[^"]*browse[^"]*"[^>]*>([^<]+)</a>'),
+        ('node', r'<a[^>]+href="[^"]*node[^"]*"[^>]*>([^<]+)</a>'),
+    )
+]
+
+_AMAZON_TEXT_PATTERNS = [
+    (literal, _compile_untrusted(pattern, re.IGNORECASE)) for literal, pattern in (
+        ('', _AMAZON_HIERARCHY_TEXT),
+        ('department:', r'Department:\s*([^\n\r]+)'),
+        ('category:', r'Category:\s*([^\n\r]+)'),
+        ('browse:', r'Browse:\s*([^\n\r]+)'),
+    )
+]
+
+# Candidate filters for Amazon DOM breadcrumbs and _is_valid_amazon_category
+_AMAZON_DOM_PROMO_RE = re.compile(r'£|\$|\d+\.\d+|\d+%\s*(off|save)|free\s+(delivery|shipping)|prime|deal|offer|save\s+\d+')
+_AMAZON_DOM_DATE_RE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|monday|tuesday|wednesday|thursday|friday|saturday|sunday|\d{1,2}\s*(st|nd|rd|th))\b')
+_AMAZON_INVALID_PRICE_RE = re.compile(r'£|\$|\d+\.\d+|\d+%|deal|offer|save|free|prime|delivery|shipping')
+_AMAZON_INVALID_DATE_RE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b')
+# Delete table for bytes.translate: every byte except ASCII letters, so the translated length
+# is the ASCII-letter count without building a regex-substituted string. This also beats
+# sum(map(str.isalpha, text)), which would additionally count non-ASCII letters.
+_NON_ALPHA_BYTES = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+# Markup stripping used to approximate soup.get_text() directly on raw HTML
+_HTML_NON_TEXT_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Amazon DOM selectors as (CSS selector, precompiled XPath) pairs for Methods 1-2
+_AMAZON_WAYFINDING_XPATH = _xpath("//div[@id='wayfinding-breadcrumbs_feature_div']")
+
+_AMAZON_DOM_SELECTORS = [
+    # Primary Amazon breadcrumb selectors
+    ("#wayfinding-breadcrumbs_feature_div a", _xpath("//*[@id='wayfinding-breadcrumbs_feature_div']//a")),
+    ("[data-component-type='s-navigation-breadcrumb'] a", _xpath("//*[@data-component-type='s-navigation-breadcrumb']//a")),
+    ("#wayfinding-breadcrumbs a", _xpath("//*[@id='wayfinding-breadcrumbs']//a")),
+    (".a-breadcrumb a", _xpath(f"//*[{_css_class('a-breadcrumb')}]//a")),
+    ("nav[aria-label*='Breadcrumb'] a", _xpath("//nav[contains(@aria-label, 'Breadcrumb')]//a")),
+    ("[aria-label*='breadcrumb'] a", _xpath("//*[contains(@aria-label, 'breadcrumb')]//a")),
+    
+    # Amazon navigation elements
+    ("#nav-subnav a", _xpath("//*[@id='nav-subnav']//a")),
+    ("#searchDropdownBox option[selected]", _xpath("//*[@id='searchDropdownBox']//option[@selected]")),
+    (".nav-breadcrumb a", _xpath(f"//*[{_css_class('nav-breadcrumb')}]//a")),
+    ("[data-csa-c-nav-item] a", _xpath("//*[@data-csa-c-nav-item]//a")),
+    ("#nav-search-dropdown-card a", _xpath("//*[@id='nav-search-dropdown-card']//a")),
+    
+    # Product page navigation
+    ("#feature-bullets .a-list-item", _xpath(f"//*[@id='feature-bullets']//*[{_css_class('a-list-item')}]")),
+    ("#productDetails_feature_div", _xpath("//*[@id='productDetails_feature_div']")),
+    ("#detailBullets_feature_div", _xpath("//*[@id='detailBullets_feature_div']")),
+    
+    # Category links in product details
+    ("a[href*='/gp/browse']", _xpath("//a[contains(@href, '/gp/browse')]")),
+    ("a[href*='/s?k=']", _xpath("//a[contains(@href, '/s?k=')]")),
+    ("a[href*='/b/']", _xpath("//a[contains(@href, '/b/')]")),
+    
+    # Alternative breadcrumb patterns
+    ("[id*='breadcrumb'] a", _xpath("//*[contains(@id, 'breadcrumb')]//a")),
+    ("[class*='breadcrumb'] a", _xpath("//*[contains(@class, 'breadcrumb')]//a")),
+    ("[data-testid*='breadcrumb'] a", _xpath("//*[contains(@data-testid, 'breadcrumb')]//a")),
+    
+    # Generic navigation that might contain category info
+    ("nav a", _xpath("//nav//a")),
+    (".navigation a", _xpath(f"//*[{_css_class('navigation')}]//a")),
+    ("[role='navigation'] a", _xpath("//*[@role='navigation']//a")),
+]
+
+def _clean_bounded(text: str, lo: int, hi: int) -> Optional[str]:
+    """Strip text once and return it if lo < len < hi, else None."""
+    text = text.strip()
+    return text if lo < len(text) < hi else None
+
+@_memoize_page_result
 def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple[List[str], str]:
     """Enhanced Amazon breadcrumb extractor with better extraction methods and anti-detection."""
     
@@ -10599,16 +11098,26 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     
     # Skip URL extraction as requested - focus only on HTML content extraction
     
+    # Shared lxml parse of this page (None -> BeautifulSoup fallback)
+    tree = _lxml_tree(html)
+    
     # Method 1: Amazon breadcrumb feature div (PRIMARY)
     try:
         # Amazon uses specific ID for breadcrumbs
-        breadcrumb_container = soup.find('div', {'id': 'wayfinding-breadcrumbs_feature_div'})
-        if breadcrumb_container:
-            breadcrumb_links = breadcrumb_container.find_all('a')
+        if tree is not None:
+            containers = _AMAZON_WAYFINDING_XPATH(tree)
+            breadcrumb_container = containers[0] if containers else None
+        else:
+            breadcrumb_container = soup.find('div', {'id': 'wayfinding-breadcrumbs_feature_div'})
+        if breadcrumb_container is not None:
+            if tree is not None:
+                breadcrumb_links = _XPATH_DESCENDANT_LINKS(breadcrumb_container)
+            else:
+                breadcrumb_links = breadcrumb_container.find_all('a')
             breadcrumbs = []
             
             for link in breadcrumb_links:
-                text = link.get_text(strip=True)
+                text = _node_text(link)
                 if text and len(text) > 1 and len(text) < 80 and text not in breadcrumbs:
                     # Clean up text
                     text = text.replace('&amp;', '&')
@@ -10623,50 +11132,13 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     
     # Method 2: Enhanced DOM selectors with comprehensive Amazon patterns
     try:
-        selectors = [
-            # Primary Amazon breadcrumb selectors
-            "#wayfinding-breadcrumbs_feature_div a",
-            "[data-component-type='s-navigation-breadcrumb'] a",
-            "#wayfinding-breadcrumbs a",
-            ".a-breadcrumb a",
-            "nav[aria-label*='Breadcrumb'] a",
-            "[aria-label*='breadcrumb'] a",
-            
-            # Amazon navigation elements
-            "#nav-subnav a",
-            "#searchDropdownBox option[selected]",
-            ".nav-breadcrumb a",
-            "[data-csa-c-nav-item] a",
-            "#nav-search-dropdown-card a",
-            
-            # Product page navigation
-            "#feature-bullets .a-list-item",
-            "#productDetails_feature_div",
-            "#detailBullets_feature_div",
-            
-            # Category links in product details
-            "a[href*='/gp/browse']",
-            "a[href*='/s?k=']",
-            "a[href*='/b/']",
-            
-            # Alternative breadcrumb patterns
-            "[id*='breadcrumb'] a",
-            "[class*='breadcrumb'] a",
-            "[data-testid*='breadcrumb'] a",
-            
-            # Generic navigation that might contain category info
-            "nav a",
-            ".navigation a",
-            "[role='navigation'] a"
-        ]
-        
-        for selector in selectors:
+        for selector, selector_xpath in _AMAZON_DOM_SELECTORS:
             try:
-                elements = soup.select(selector)
+                elements = selector_xpath(tree) if tree is not None else soup.select(selector)
                 if elements:
                     breadcrumbs = []
                     for elem in elements:
-                        text = elem.get_text(strip=True)
+                        text = _node_text(elem)
                         
                         # More aggressive text extraction for Amazon
                         if text and len(text) > 1 and len(text) < 150:  # Allow longer text
@@ -10686,7 +11158,7 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
                                 continue
                                 
                             # Skip if it starts with unwanted prefixes
-                            if text_lower.startswith(('back ', 'see all', 'view all', 'show more', 'shop ', 'browse ', 'hello,', 'currently', 'get it by')):
+                            if _AMAZON_SKIP_PREFIX_RE.match(text_lower):
                                 continue
                                 
                             # Skip if it ends with unwanted suffixes
@@ -10694,11 +11166,11 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
                                 continue
                                 
                             # Skip if it contains prices, deals, or promotional content
-                            if re.search(r'£|\$|\d+\.\d+|\d+%\s*(off|save)|free\s+(delivery|shipping)|prime|deal|offer|save\s+\d+', text_lower):
+                            if _AMAZON_DOM_PROMO_RE.search(text_lower):
                                 continue
                                 
                             # Skip if it looks like a date or time
-                            if re.search(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|monday|tuesday|wednesday|thursday|friday|saturday|sunday|\d{1,2}\s*(st|nd|rd|th))\b', text_lower):
+                            if _AMAZON_DOM_DATE_RE.search(text_lower):
                                 continue
                             
                             # Clean up text
@@ -10728,76 +11200,63 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     
     # Method 3: JSON-LD structured data (Enhanced)
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
-                    
-                    for obj in candidates:
-                        if isinstance(obj, dict):
-                            # Product with category
-                            if obj.get('@type') == 'Product':
-                                category = obj.get('category')
-                                if category:
-                                    if isinstance(category, str) and category.strip():
-                                        # Handle different category formats
-                                        if ' > ' in category:
-                                            parts = [p.strip() for p in category.split(' > ') if p.strip()]
-                                        elif '/' in category:
-                                            parts = [p.strip() for p in category.split('/') if p.strip()]
-                                        elif ',' in category:
-                                            parts = [p.strip() for p in category.split(',') if p.strip()]
-                                        else:
-                                            parts = [category.strip()]
-                                        
-                                        # Filter out generic terms
-                                        filtered_parts = [p for p in parts if p.lower() not in {'amazon', 'products', 'all'}]
-                                        
-                                        if filtered_parts and len(filtered_parts) <= 6:
-                                            logger.info(f"Amazon: Found JSON-LD product category: {filtered_parts}")
-                                            return filtered_parts, "amazon_json_ld_product_category"
-                                    elif isinstance(category, list) and len(category) <= 6:
-                                        filtered_cats = [c for c in category if isinstance(c, str) and c.lower() not in {'amazon', 'products', 'all'}]
-                                        if filtered_cats:
-                                            logger.info(f"Amazon: Found JSON-LD category list: {filtered_cats}")
-                                            return filtered_cats, "amazon_json_ld_category_list"
+        for obj in _jsonld_objects(soup, tree):
+            if isinstance(obj, dict):
+                # Product with category
+                if obj.get('@type') == 'Product':
+                    category = obj.get('category')
+                    if category:
+                        if isinstance(category, str) and category.strip():
+                            # Handle different category formats
+                            if ' > ' in category:
+                                parts = [p.strip() for p in category.split(' > ') if p.strip()]
+                            elif '/' in category:
+                                parts = [p.strip() for p in category.split('/') if p.strip()]
+                            elif ',' in category:
+                                parts = [p.strip() for p in category.split(',') if p.strip()]
+                            else:
+                                parts = [category.strip()]
                             
-                            # BreadcrumbList
-                            elif obj.get('@type') == 'BreadcrumbList':
-                                items = obj.get('itemListElement', [])
-                                breadcrumbs = []
-                                
-                                # Sort by position if available
-                                try:
-                                    items = sorted(items, key=lambda x: x.get('position', 0))
-                                except:
-                                    pass
-                                
-                                for item in items:
-                                    if isinstance(item, dict):
-                                        name = item.get('name') or (item.get('item', {}).get('name') if isinstance(item.get('item'), dict) else None)
-                                        if name and isinstance(name, str) and name.strip():
-                                            clean_name = name.strip()
-                                            if clean_name.lower() not in {'amazon', 'home', 'all departments'}:
-                                                breadcrumbs.append(clean_name)
-                                
-                                if breadcrumbs and len(breadcrumbs) <= 6:
-                                    logger.info(f"Amazon: Found JSON-LD breadcrumb list: {breadcrumbs}")
-                                    return breadcrumbs, "amazon_json_ld_breadcrumb_list"
-                                    
-                except json.JSONDecodeError:
-                    continue
+                            # Filter out generic terms
+                            filtered_parts = [p for p in parts if p.lower() not in {'amazon', 'products', 'all'}]
+                            
+                            if filtered_parts and len(filtered_parts) <= 6:
+                                logger.info(f"Amazon: Found JSON-LD product category: {filtered_parts}")
+                                return filtered_parts, "amazon_json_ld_product_category"
+                        elif isinstance(category, list) and len(category) <= 6:
+                            filtered_cats = [c for c in category if isinstance(c, str) and c.lower() not in {'amazon', 'products', 'all'}]
+                            if filtered_cats:
+                                logger.info(f"Amazon: Found JSON-LD category list: {filtered_cats}")
+                                return filtered_cats, "amazon_json_ld_category_list"
+                
+                # BreadcrumbList
+                elif obj.get('@type') == 'BreadcrumbList':
+                    items = obj.get('itemListElement', [])
+                    breadcrumbs = []
+                    
+                    # Sort by position if available
+                    items = sorted(items, key=_safe_position)
+                    
+                    for item in items:
+                        if isinstance(item, dict):
+                            name = item.get('name') or (item.get('item', {}).get('name') if isinstance(item.get('item'), dict) else None)
+                            if name and isinstance(name, str) and name.strip():
+                                clean_name = name.strip()
+                                if clean_name.lower() not in {'amazon', 'home', 'all departments'}:
+                                    breadcrumbs.append(clean_name)
+                    
+                    if breadcrumbs and len(breadcrumbs) <= 6:
+                        logger.info(f"Amazon: Found JSON-LD breadcrumb list: {breadcrumbs}")
+                        return breadcrumbs, "amazon_json_ld_breadcrumb_list"
     
     except Exception as e:
         logger.debug(f"Amazon JSON-LD extraction failed: {e}")
     
     # Method 4: Page title analysis (FALLBACK)
     try:
-        title_tag = soup.find('title')
-        if title_tag and title_tag.string:
-            title = title_tag.string.strip()
+        title = _page_title(soup, tree)
+        if title:
+            title = title.strip()
             logger.debug(f"Amazon: Page title: {title}")
             
             # Amazon titles often contain category info
@@ -10825,50 +11284,28 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     # Method 5: Extract from Amazon product details and page structure
     try:
         # Look for category information in various parts of the Amazon page
-        category_extraction_patterns = [
-            # Department/category data attributes
-            r'data-department="([^"]+)"',
-            r'data-category="([^"]+)"',
-            r'data-csa-c-department-id="([^"]+)"',
-            
-            # JSON data patterns
-            r'"department"\s*:\s*"([^"]+)"',
-            r'"categoryName"\s*:\s*"([^"]+)"',
-            r'"category"\s*:\s*"([^"]+)"',
-            r'"departmentName"\s*:\s*"([^"]+)"',
-            
-            # Breadcrumb patterns in various formats
-            r'breadcrumb[^>]*>([^<]+)<',
-            r'class="[^"]*breadcrumb[^"]*"[^>]*>([^<]+)<',
-            
-            # Category hierarchy patterns
-            r'([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*(?:\s+[A-Z][a-z]+)*)\s*[>›]\s*([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*)',
-            
-            # Amazon specific navigation patterns
-            r'<a[^>]+href="[^"]*browse[^"]*"[^>]*>([^<]+)</a>',
-            r'<a[^>]+href="[^"]*node[^"]*"[^>]*>([^<]+)</a>',
-        ]
-        
-        found_categories = []
-        for pattern in category_extraction_patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                # Handle tuple matches from group patterns
-                if isinstance(match, tuple):
-                    for m in match:
-                        if m and len(m.strip()) > 2 and len(m.strip()) < 100:
-                            cleaned = m.strip()
-                            if _is_valid_amazon_category(cleaned) and cleaned not in found_categories:
-                                found_categories.append(cleaned)
-                else:
-                    if match and len(match.strip()) > 2 and len(match.strip()) < 100:
-                        cleaned = match.strip()
-                        if _is_valid_amazon_category(cleaned) and cleaned not in found_categories:
-                            found_categories.append(cleaned)
+        found_categories = {}  # Insertion-ordered set: O(1) de-dup per match
+        html_lower = html.lower()
+        for literal, pattern in _AMAZON_STRUCT_PATTERNS:
+            if literal not in html_lower:
+                continue
+            # Normalise plain-string matches to 1-tuples so group and non-group patterns flatten the same way
+            matches = pattern.findall(html)
+            for m in chain.from_iterable((match,) if isinstance(match, str) else match for match in matches):
+                cleaned = _clean_bounded(m, 2, 100)
+                if cleaned is None:
+                    continue
+                if _is_valid_amazon_category(cleaned):
+                    found_categories.setdefault(cleaned, None)
+                    if len(found_categories) >= 6:
+                        break
+            # Only 6 categories are returned, so stop scanning further patterns once we have them
+            if len(found_categories) >= 6:
+                break
         
         if found_categories:
             # Limit to reasonable number and clean up
-            limited_cats = found_categories[:6]
+            limited_cats = list(found_categories)[:6]
             logger.info(f"Amazon: Found categories in page structure: {limited_cats}")
             return limited_cats, "amazon_page_structure_analysis"
     
@@ -10877,35 +11314,32 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     
     # Method 6: Extract from page title and meta tags (more aggressive)
     try:
-        # Check all text content for category-like patterns
-        all_text = soup.get_text() if soup else html
+        # Check all text content for category-like patterns. The text is derived from the raw
+        # HTML with two C-level regex passes rather than a soup.get_text() walk of the whole tree.
+        all_text = html_unescape(_HTML_TAG_RE.sub('', _HTML_NON_TEXT_RE.sub('', html)))
         
         # Look for category patterns in the entire page text
-        category_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*(?:\s+[A-Z][a-z]+)*)\s*[>›]\s*([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*(?:\s+[A-Z][a-z]+)*)',
-            r'Department:\s*([^\n\r]+)',
-            r'Category:\s*([^\n\r]+)',
-            r'Browse:\s*([^\n\r]+)',
-        ]
-        
-        text_categories = []
-        for pattern in category_patterns:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    for m in match:
-                        if m and len(m.strip()) > 2 and len(m.strip()) < 80:
-                            cleaned = m.strip()
-                            if _is_valid_amazon_category(cleaned) and cleaned not in text_categories:
-                                text_categories.append(cleaned)
-                else:
-                    if match and len(match.strip()) > 2 and len(match.strip()) < 80:
-                        cleaned = match.strip()
-                        if _is_valid_amazon_category(cleaned) and cleaned not in text_categories:
-                            text_categories.append(cleaned)
+        text_categories = {}  # Insertion-ordered set: O(1) de-dup per match
+        text_lower = all_text.lower()
+        for literal, pattern in _AMAZON_TEXT_PATTERNS:
+            if literal not in text_lower:
+                continue
+            # Normalise plain-string matches to 1-tuples so group and non-group patterns flatten the same way
+            matches = pattern.findall(all_text)
+            for m in chain.from_iterable((match,) if isinstance(match, str) else match for match in matches):
+                cleaned = _clean_bounded(m, 2, 80)
+                if cleaned is None:
+                    continue
+                if _is_valid_amazon_category(cleaned):
+                    text_categories.setdefault(cleaned, None)
+                    if len(text_categories) >= 4:
+                        break
+            # Only 4 categories are returned, so stop scanning further patterns once we have them
+            if len(text_categories) >= 4:
+                break
         
         if text_categories:
-            limited_text_cats = text_categories[:4]
+            limited_text_cats = list(text_categories)[:4]
             logger.info(f"Amazon: Found categories in page text: {limited_text_cats}")
             return limited_text_cats, "amazon_full_text_analysis"
     
@@ -10915,40 +11349,48 @@ def scrape_amazon_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     logger.debug("Amazon: No meaningful breadcrumbs could be extracted")
     return [], "amazon_no_breadcrumbs_found"
 
+# Maps URL slug separators to spaces in a single C-level pass (shared with the Savers URL parser)
+_URL_SEPARATOR_TABLE = str.maketrans({'-': ' ', '_': ' '})
+
+# Obvious non-category terms rejected by _is_valid_amazon_category
+_AMAZON_INVALID_TERMS = frozenset({
+    'amazon', 'amazon.co.uk', 'amazon.com', 'home', 'search', 'account', 
+    'basket', 'checkout', 'sign', 'hello', 'prime', 'delivery', 'returns', 
+    'help', 'customer', 'service', 'sponsored', 'advertisement', 'ad',
+    'click', 'buy', 'add', 'cart', 'wish', 'list', 'save', 'share',
+    'compare', 'review', 'rating', 'star', 'vote', 'comment', 'question',
+    'answer', 'ask', 'tell', 'about', 'this', 'that', 'item', 'product'
+})
+
+_AMAZON_BAD_PREFIXES = ('http', 'www', 'get ', 'buy ', 'add ', 'click ', 'see ', 'view ', 'show ', 'more ', 'back ')
+
+@lru_cache(maxsize=4096)
 def _is_valid_amazon_category(text: str) -> bool:
-    """Check if text looks like a valid Amazon category."""
-    if not text or len(text.strip()) < 2:
+    """Check if text looks like a valid Amazon category (memoized; candidates repeat heavily)."""
+    stripped = text.strip() if text else ''
+    if len(stripped) < 2:
         return False
         
-    text_lower = text.lower().strip()
+    text_lower = stripped.lower()
     
     # Exclude obvious non-categories
-    invalid_terms = {
-        'amazon', 'amazon.co.uk', 'amazon.com', 'home', 'search', 'account', 
-        'basket', 'checkout', 'sign', 'hello', 'prime', 'delivery', 'returns', 
-        'help', 'customer', 'service', 'sponsored', 'advertisement', 'ad',
-        'click', 'buy', 'add', 'cart', 'wish', 'list', 'save', 'share',
-        'compare', 'review', 'rating', 'star', 'vote', 'comment', 'question',
-        'answer', 'ask', 'tell', 'about', 'this', 'that', 'item', 'product'
-    }
-    
-    if text_lower in invalid_terms:
+    if text_lower in _AMAZON_INVALID_TERMS:
         return False
     
     # Skip if it looks like a price, deal, or promotional text
-    if re.search(r'£|\$|\d+\.\d+|\d+%|deal|offer|save|free|prime|delivery|shipping', text_lower):
+    if _AMAZON_INVALID_PRICE_RE.search(text_lower):
         return False
     
     # Skip if it looks like a date or time
-    if re.search(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', text_lower):
+    if _AMAZON_INVALID_DATE_RE.search(text_lower):
         return False
     
     # Skip if it's mostly numbers or symbols
-    if len(re.sub(r'[^a-zA-Z]', '', text)) < len(text) * 0.5:
+    if len(text.encode('latin-1', 'ignore').translate(None, _NON_ALPHA_BYTES)) * 2 < len(text):
         return False
     
     # Skip if it starts with common non-category prefixes
-    if text_lower.startswith(('http', 'www', 'get ', 'buy ', 'add ', 'click ', 'see ', 'view ', 'show ', 'more ', 'back ')):
+    if text_lower.startswith(_AMAZON_BAD_PREFIXES):
         return False
     
     return True
@@ -10959,8 +11401,6 @@ def _extract_amazon_from_url(url: str) -> Tuple[List[str], str]:
         return [], "amazon_no_url"
     
     try:
-        from urllib.parse import urlparse, unquote
-        
         parsed = urlparse(url)
         path = parsed.path
         
@@ -11004,7 +11444,7 @@ def _extract_amazon_from_url(url: str) -> Tuple[List[str], str]:
                 continue
             
             # Convert URL segment to readable format
-            readable = segment.replace('-', ' ').replace('_', ' ')
+            readable = segment.translate(_URL_SEPARATOR_TABLE)
             
             # Title case formatting
             readable = ' '.join(word.capitalize() for word in readable.split())
@@ -11021,7 +11461,6 @@ def _extract_amazon_from_url(url: str) -> Tuple[List[str], str]:
             return category_segments, "amazon_url_path_analysis"
         
         # Try to extract from query parameters
-        from urllib.parse import parse_qs
         query_params = parse_qs(parsed.query)
         
         # Look for category-related query parameters
@@ -11032,7 +11471,7 @@ def _extract_amazon_from_url(url: str) -> Tuple[List[str], str]:
                 for value in values:
                     if value and len(value) > 2 and not value.isdigit():
                         # Clean up the value
-                        cleaned = unquote(value).replace('-', ' ').replace('_', ' ')
+                        cleaned = unquote(value).translate(_URL_SEPARATOR_TABLE)
                         cleaned = ' '.join(word.capitalize() for word in cleaned.split())
                         if cleaned:
                             logger.debug(f"Amazon URL: Found category in query param {param}: {cleaned}")
@@ -11048,6 +11487,57 @@ def _extract_amazon_from_url(url: str) -> Tuple[List[str], str]:
 # POUNDLAND SCRAPER IMPLEMENTATION (6-LEVEL SUPPORT)
 # ------------------------------------------------------------------
 
+# Fallback patterns for breadcrumb-like text in Poundland HTML (Method 4)
+_POUNDLAND_TEXT_PATTERNS = [
+    _compile_untrusted(pattern, re.IGNORECASE) for pattern in (
+        # Look for 'Home/Category1/Category2' patterns in text content
+        r'Home[/\\>]([^/\\>\n<]+)[/\\>]([^/\\>\n<]+)(?:[/\\>]([^/\\>\n<]+))?',
+        # Look for category paths in link structures
+        r'(?:Food and Drink|Health & Beauty|Household)[^\n<]*(?:Food Cupboard|Hair Care|Cleaning)',
+    )
+]
+
+# Link text filters shared by the DOM and JSON-LD methods
+_POUNDLAND_SKIP_TERMS = frozenset({'back', 'home', 'homepage', 'poundland'})
+_POUNDLAND_NAV_SKIP_TERMS = _POUNDLAND_SKIP_TERMS | {'menu', 'search', 'account', 'basket'}
+_POUNDLAND_SKIP_PREFIXES = ('back to', 'shop', 'browse')
+_POUNDLAND_LINK_SKIP_PREFIXES = ('back', 'shop', 'browse', 'see all')
+_POUNDLAND_NAV_SKIP_PREFIXES = ('back to', 'shop', 'browse', 'see all', 'view all', 'sign in')
+
+# DOM selectors as (CSS selector, precompiled XPath) pairs; the CSS form is used for the
+# BeautifulSoup fallback and for logging/method names
+_POUNDLAND_BREADCRUMBS_XPATH = _xpath(f"//*[{_css_class('breadcrumbs')}]")
+
+_POUNDLAND_BREADCRUMB_SELECTORS = [
+    (".breadcrumbs a", _xpath(f"//*[{_css_class('breadcrumbs')}]//a")),  # Primary selector from analysis
+    ("[class*='breadcrumb'] a", _xpath("//*[contains(@class, 'breadcrumb')]//a")),  # Backup selector
+]
+
+# Method 5 navigation selectors as (CSS, XPath) source pairs, tried in order: the first selector
+# yielding two crumbs wins, so header/mega-menu links never mix into a real breadcrumb trail
+_POUNDLAND_NAV_SELECTORS = [
+    # More generic breadcrumb patterns that might exist
+    ("nav ol li a", "//nav//ol//li//a"),  # Common breadcrumb structure
+    ("nav ul li a", "//nav//ul//li//a"),  # Alternative breadcrumb structure
+    (".navigation a", f"//*[{_css_class('navigation')}]//a"),  # Navigation links
+    ("[aria-label*='navigation'] a", "//*[contains(@aria-label, 'navigation')]//a"),
+    ("[data-testid*='breadcrumb'] a", "//*[contains(@data-testid, 'breadcrumb')]//a"),
+    (".page-navigation a", f"//*[{_css_class('page-navigation')}]//a"),
+    ("#navigation a", "//*[@id='navigation']//a"),
+    
+    # Menu/category navigation that might contain breadcrumbs
+    (".menu a", f"//*[{_css_class('menu')}]//a"),
+    (".nav a", f"//*[{_css_class('nav')}]//a"),
+    (".category a", f"//*[{_css_class('category')}]//a"),
+    ("[role='navigation'] a", "//*[@role='navigation']//a"),
+]
+_POUNDLAND_NAV_QUERIES = tuple((css, _xpath(xpath)) for css, xpath in _POUNDLAND_NAV_SELECTORS)
+# Every selector's hits are a subset of this union's, so one union query rules out pages that
+# cannot yield two crumbs before the selectors run one by one
+_POUNDLAND_NAV_UNION_CSS = ", ".join(css for css, _ in _POUNDLAND_NAV_SELECTORS)
+_POUNDLAND_NAV_UNION_XPATH = _xpath(" | ".join(xpath for _, xpath in _POUNDLAND_NAV_SELECTORS))
+
+@_memoize_page_result
 def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple[List[str], str]:
     """Enhanced Poundland breadcrumb extractor with real website DOM selectors."""
     
@@ -11059,21 +11549,31 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
         logger.debug("Poundland: No category structure in URL path, cannot extract from empty HTML")
         return [], "poundland_empty_html_no_extraction"
     
+    # Parse once with lxml for the DOM methods below (None -> BeautifulSoup fallback)
+    tree = _lxml_tree(html)
+    
     # Method 1: Extract from actual Poundland .breadcrumbs selector (PRIMARY METHOD)
     try:
         # Based on analysis: .breadcrumbs contains links: 'Back', 'Home', 'Food and Drink', 'Food Cupboard'
-        breadcrumb_container = soup.select('.breadcrumbs')
+        if tree is not None:
+            breadcrumb_container = _POUNDLAND_BREADCRUMBS_XPATH(tree)
+        else:
+            breadcrumb_container = soup.select('.breadcrumbs')
         if breadcrumb_container:
             # Get all links within the breadcrumbs container
-            links = breadcrumb_container[0].find_all('a')
+            if tree is not None:
+                links = _XPATH_DESCENDANT_LINKS(breadcrumb_container[0])
+            else:
+                links = breadcrumb_container[0].find_all('a')
             if links:
                 breadcrumbs = []
                 for link in links:
-                    text = link.get_text(strip=True)
+                    text = _node_text(link)
+                    text_lower = text.lower()
                     # Skip 'Back', 'Home' and keep the actual category path
                     if (text and len(text) > 1 and len(text) < 100 and
-                        text.lower() not in {'back', 'home', 'homepage', 'poundland'} and
-                        not text.lower().startswith(('back to', 'shop', 'browse'))):
+                        text_lower not in _POUNDLAND_SKIP_TERMS and
+                        not text_lower.startswith(_POUNDLAND_SKIP_PREFIXES)):
                         breadcrumbs.append(text)
                 
                 if breadcrumbs and len(breadcrumbs) <= 6:
@@ -11086,24 +11586,20 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
     # Method 2: Extract from .breadcrumbs links with broader selector
     try:
         # Try with more specific breadcrumb link selectors found in analysis
-        breadcrumb_selectors = [
-            ".breadcrumbs a",  # Primary selector from analysis
-            "[class*='breadcrumb'] a",  # Backup selector
-        ]
-        
-        for selector in breadcrumb_selectors:
+        for selector, selector_xpath in _POUNDLAND_BREADCRUMB_SELECTORS:
             try:
-                elements = soup.select(selector)
+                elements = selector_xpath(tree) if tree is not None else soup.select(selector)
                 if elements:
                     breadcrumbs = []
                     for elem in elements:
-                        text = elem.get_text(strip=True)
+                        text = _node_text(elem)
+                        text_lower = text.lower()
                         href = elem.get('href', '')
                         
                         # More specific filtering based on actual Poundland structure
                         if (text and len(text) > 1 and len(text) < 100 and
-                            text.lower() not in {'back', 'home', 'homepage', 'poundland'} and
-                            not text.lower().startswith(('back', 'shop', 'browse', 'see all')) and
+                            text_lower not in _POUNDLAND_SKIP_TERMS and
+                            not text_lower.startswith(_POUNDLAND_LINK_SKIP_PREFIXES) and
                             href and href != '#'):
                             breadcrumbs.append(text)
                     
@@ -11120,41 +11616,29 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
     
     # Method 3: JSON-LD BreadcrumbList
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
-                    
-                    for obj in candidates:
-                        if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
-                            items = obj.get('itemListElement', [])
-                            breadcrumbs = []
-                            
-                            try:
-                                sorted_items = sorted(items, key=lambda x: x.get('position', 0))
-                            except:
-                                sorted_items = items
-                            
-                            for item in sorted_items:
-                                if isinstance(item, dict):
-                                    name = item.get('name')
-                                    if not name and isinstance(item.get('item'), dict):
-                                        name = item['item'].get('name')
-                                    
-                                    if name and isinstance(name, str) and len(name) > 1:
-                                        clean_name = name.strip()
-                                        if (clean_name.lower() not in {'poundland', 'home', 'homepage', 'back'} and
-                                            not clean_name.lower().startswith(('back to', 'shop', 'browse'))):
-                                            breadcrumbs.append(clean_name)
-                            
-                            if breadcrumbs and len(breadcrumbs) <= 6:
-                                logger.info(f"Poundland: Extracted breadcrumbs from JSON-LD: {breadcrumbs}")
-                                return breadcrumbs, "poundland_json_ld_6level"
+        for obj in _jsonld_objects(soup, tree):
+            if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
+                items = obj.get('itemListElement', [])
+                breadcrumbs = []
                 
-                except json.JSONDecodeError:
-                    continue
+                sorted_items = sorted(items, key=_safe_position)
+                
+                for item in sorted_items:
+                    if isinstance(item, dict):
+                        name = item.get('name')
+                        if not name and isinstance(item.get('item'), dict):
+                            name = item['item'].get('name')
+                        
+                        if name and isinstance(name, str) and len(name) > 1:
+                            clean_name = name.strip()
+                            clean_lower = clean_name.lower()
+                            if (clean_lower not in _POUNDLAND_SKIP_TERMS and
+                                not clean_lower.startswith(_POUNDLAND_SKIP_PREFIXES)):
+                                breadcrumbs.append(clean_name)
+                
+                if breadcrumbs and len(breadcrumbs) <= 6:
+                    logger.info(f"Poundland: Extracted breadcrumbs from JSON-LD: {breadcrumbs}")
+                    return breadcrumbs, "poundland_json_ld_6level"
     
     except Exception as e:
         logger.debug(f"Poundland JSON-LD extraction failed: {e}")
@@ -11162,18 +11646,8 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
     # Method 4: Fallback - extract from breadcrumb text patterns
     try:
         # Look for the text pattern we found: 'BackHome/Food and Drink/Food Cupboard/...'
-        import re
-        
-        # Pattern to extract category names from breadcrumb text
-        text_patterns = [
-            # Look for 'Home/Category1/Category2' patterns in text content
-            r'Home[/\\>]([^/\\>\n<]+)[/\\>]([^/\\>\n<]+)(?:[/\\>]([^/\\>\n<]+))?',
-            # Look for category paths in link structures
-            r'(?:Food and Drink|Health & Beauty|Household)[^\n<]*(?:Food Cupboard|Hair Care|Cleaning)',
-        ]
-        
-        for pattern in text_patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE)
+        for pattern in _POUNDLAND_TEXT_PATTERNS:
+            matches = pattern.findall(html)
             if matches:
                 logger.debug(f"Poundland: Found {len(matches)} text pattern matches")
                 
@@ -11184,10 +11658,11 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
                         for part in match:
                             if part and part.strip():
                                 clean_part = part.strip()
+                                part_lower = clean_part.lower()
                                 # Skip product names and keep categories
                                 if (len(clean_part) < 50 and
-                                    not clean_part.lower().endswith(('g', 'ml', 'kg', 'pack')) and
-                                    clean_part.lower() not in {'back', 'home', 'homepage'}):
+                                    not part_lower.endswith(('g', 'ml', 'kg', 'pack')) and
+                                    part_lower not in {'back', 'home', 'homepage'}):
                                     categories.append(clean_part)
                         
                         if categories and len(categories) <= 6:
@@ -11200,53 +11675,38 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
     # Method 5: Enhanced breadcrumb extraction from page elements
     try:
         # Based on external context analysis, look for more breadcrumb patterns
-        additional_selectors = [
-            # More generic breadcrumb patterns that might exist
-            "nav ol li a",  # Common breadcrumb structure
-            "nav ul li a",  # Alternative breadcrumb structure  
-            ".navigation a", # Navigation links
-            "[aria-label*='navigation'] a",
-            "[data-testid*='breadcrumb'] a",
-            ".page-navigation a",
-            "#navigation a",
-            
-            # Menu/category navigation that might contain breadcrumbs
-            ".menu a", 
-            ".nav a",
-            ".category a",
-            "[role='navigation'] a"
-        ]
+        if tree is not None:
+            candidates = _POUNDLAND_NAV_UNION_XPATH(tree)
+        else:
+            candidates = soup.select(_POUNDLAND_NAV_UNION_CSS)
         
-        for selector in additional_selectors:
+        # Fewer than two links in the union means no single selector can find two crumbs
+        for selector, selector_xpath in (_POUNDLAND_NAV_QUERIES if len(candidates) >= 2 else ()):
             try:
-                elements = soup.select(selector)
+                elements = selector_xpath(tree) if tree is not None else soup.select(selector)
                 if elements:
                     breadcrumbs = []
                     for elem in elements:
-                        text = elem.get_text(strip=True)
+                        text = _node_text(elem)
+                        text_lower = text.lower()
                         href = elem.get('href', '')
                         
                         # Filter for category-like links
                         if (text and len(text) > 1 and len(text) < 50 and
-                            text.lower() not in {'back', 'home', 'homepage', 'poundland', 'menu', 'search', 'account', 'basket'} and
-                            not text.lower().startswith(('back to', 'shop', 'browse', 'see all', 'view all', 'sign in')) and
-                            href and href not in ['#', 'javascript:void(0)']):
+                            text_lower not in _POUNDLAND_NAV_SKIP_TERMS and
+                            not text_lower.startswith(_POUNDLAND_NAV_SKIP_PREFIXES) and
+                            href and href not in ('#', 'javascript:void(0)')):
                             
                             breadcrumbs.append(text)
                     
-                    # Remove duplicates and limit
+                    # Remove duplicates (order-preserving) and limit
                     if breadcrumbs:
-                        seen = set()
-                        unique_breadcrumbs = []
-                        for crumb in breadcrumbs:
-                            if crumb not in seen and len(unique_breadcrumbs) < 6:
-                                seen.add(crumb)
-                                unique_breadcrumbs.append(crumb)
+                        unique_breadcrumbs = list(dict.fromkeys(breadcrumbs))[:6]
                         
                         if len(unique_breadcrumbs) >= 2:
                             logger.debug(f"Poundland: Found navigation breadcrumbs with '{selector}': {unique_breadcrumbs}")
-                            return unique_breadcrumbs[:6], f"poundland_nav_{selector[:20]}"
-                        
+                            return unique_breadcrumbs, f"poundland_nav_{selector[:20]}"
+            
             except Exception as e:
                 logger.debug(f"Poundland selector '{selector}' failed: {e}")
                 continue
@@ -11260,13 +11720,66 @@ def scrape_poundland_improved(soup: BeautifulSoup, html: str, url: str = "") ->
 # SAVERS SCRAPER IMPLEMENTATION (6-LEVEL SUPPORT)
 # ------------------------------------------------------------------
 
+# URL slug words that need special casing ('and' -> '&', connectives stay lowercase)
+_SAVERS_LOWERCASE_WORDS = frozenset({'of', 'for', 'the', 'with', 'in', 'on', 'at'})
+_SAVERS_SMART_CASE_WORDS = _SAVERS_LOWERCASE_WORDS | {'and'}
+
+# Title-cased slug fragments rewritten to their display form, all in one substitution pass
+_SAVERS_READABLE_MAP = {'Make Up': 'Make-up', 'Mens': "Men's", 'Womens': "Women's"}
+_SAVERS_READABLE_RE = re.compile('|'.join(map(re.escape, _SAVERS_READABLE_MAP)))
+
+# Only JSON-LD scripts mentioning these @types are worth parsing
+_SAVERS_JSONLD_MARKERS = ('BreadcrumbList',)
+
+# Breadcrumb text filters for the JSON-LD and DOM methods
+_SAVERS_JSONLD_SKIP_TERMS = frozenset({'savers', 'home', 'homepage'})
+_SAVERS_JSONLD_SKIP_PREFIXES = ('back to', 'shop', 'browse')
+_SAVERS_DOM_SKIP_TERMS = _SAVERS_JSONLD_SKIP_TERMS | {'shop', 'browse'}
+_SAVERS_DOM_SKIP_PREFIXES = ('back to', 'shop all', 'view all', 'see all')
+
+# Price/promotion noise that disqualifies a DOM breadcrumb candidate. Every match of the regex
+# contains one of the literals, so a plain substring scan rules out most candidates without it.
+_SAVERS_PRICE_NOISE_RE = re.compile(r'\b(£|\d+\.\d+|free|save|offer|%|off)\b')
+_SAVERS_PRICE_NOISE_LITERALS = ('£', '%', '.', 'free', 'save', 'offer', 'off')
+
+def _has_price_noise(text_lower: str, literals: Tuple[str, ...], pattern: re.Pattern) -> bool:
+    """True if pattern matches text_lower, only running the regex when one of its literals is present."""
+    for literal in literals:
+        if literal in text_lower:
+            return pattern.search(text_lower) is not None
+    return False
+
+# DOM breadcrumb selectors as (CSS, XPath) source pairs, run as a single union query. The broader
+# .category-nav selector stays a separate fallback after it, so menu links never get mixed into a
+# real breadcrumb trail.
+_SAVERS_BREADCRUMB_SELECTORS = (
+    ("nav[aria-label*='breadcrumb'] a", "//nav[contains(@aria-label, 'breadcrumb')]//a"),
+    (".breadcrumb a", f"//*[{_css_class('breadcrumb')}]//a"),
+    (".breadcrumbs a", f"//*[{_css_class('breadcrumbs')}]//a"),
+    ("ol.breadcrumb a", f"//ol[{_css_class('breadcrumb')}]//a"),
+    ("ul.breadcrumb a", f"//ul[{_css_class('breadcrumb')}]//a"),
+    (".product-breadcrumb a", f"//*[{_css_class('product-breadcrumb')}]//a"),
+    (".navigation-breadcrumb a", f"//*[{_css_class('navigation-breadcrumb')}]//a"),
+    ("[data-testid*='breadcrumb'] a", "//*[contains(@data-testid, 'breadcrumb')]//a"),
+)
+_SAVERS_BREADCRUMB_UNION_CSS = ", ".join(css for css, _ in _SAVERS_BREADCRUMB_SELECTORS)
+_SAVERS_BREADCRUMB_UNION_XPATH = _xpath(" | ".join(xpath for _, xpath in _SAVERS_BREADCRUMB_SELECTORS))
+
+# (CSS selector, precompiled XPath) queries for Method 2, tried in order
+_SAVERS_DOM_QUERIES = (
+    (_SAVERS_BREADCRUMB_UNION_CSS, _SAVERS_BREADCRUMB_UNION_XPATH),
+    (".category-nav a", _xpath(f"//*[{_css_class('category-nav')}]//a")),
+)
+
+@_memoize_page_result
 def scrape_savers_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tuple[List[str], str]:
     """Enhanced Savers breadcrumb extractor with URL-based extraction as primary method."""
     
+    # Shared lxml parse of this page (None -> BeautifulSoup fallback)
+    tree = _lxml_tree(html)
+    
     # Method 1: URL-based extraction (PRIMARY - fastest, most reliable, exact results)
     try:
-        from urllib.parse import urlparse, unquote
-        
         parsed_url = urlparse(url)
         path = parsed_url.path.strip('/')
         
@@ -11286,29 +11799,26 @@ def scrape_savers_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
                     continue
                     
                 # Convert URL slug to readable format using intelligent logic (no hardcoding)
-                readable = segment.replace('-', ' ').replace('_', ' ')
+                readable = segment.translate(_URL_SEPARATOR_TABLE)
                 
                 # Intelligent formatting: title case each word, handle & properly
                 words = readable.split()
-                formatted_words = []
-                for word in words:
-                    if word.lower() == 'and':
-                        formatted_words.append('&')
-                    elif word.lower() in ['of', 'for', 'the', 'with', 'in', 'on', 'at']:
-                        formatted_words.append(word.lower())
-                    else:
-                        formatted_words.append(word.capitalize())
-                readable = ' '.join(formatted_words)
+                if _SAVERS_SMART_CASE_WORDS.isdisjoint(map(str.lower, words)):
+                    # Common case: plain title case, no per-word special handling needed
+                    readable = ' '.join(word.capitalize() for word in words)
+                else:
+                    formatted_words = []
+                    for word in words:
+                        if word.lower() == 'and':
+                            formatted_words.append('&')
+                        elif word.lower() in _SAVERS_LOWERCASE_WORDS:
+                            formatted_words.append(word.lower())
+                        else:
+                            formatted_words.append(word.capitalize())
+                    readable = ' '.join(formatted_words)
                 
                 # Handle common patterns intelligently
-                if 'care' in readable.lower():
-                    readable = readable.replace(' Care', ' Care')  # Ensure proper capitalization
-                if 'make up' in readable.lower():
-                    readable = readable.replace('Make Up', 'Make-up')
-                if 'mens' in readable.lower():
-                    readable = readable.replace('Mens', "Men's")
-                if 'womens' in readable.lower():
-                    readable = readable.replace('Womens', "Women's")
+                readable = _SAVERS_READABLE_RE.sub(lambda m: _SAVERS_READABLE_MAP[m.group()], readable)
                 
                 breadcrumbs.append(readable)
             
@@ -11322,72 +11832,55 @@ def scrape_savers_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
     
     # Method 2: JSON-LD extraction
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
-                    
-                    for obj in candidates:
-                        if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
-                            items = obj.get('itemListElement', [])
-                            breadcrumbs = []
-                            
-                            try:
-                                sorted_items = sorted(items, key=lambda x: x.get('position', 0))
-                            except:
-                                sorted_items = items
-                            
-                            for item in sorted_items:
-                                if isinstance(item, dict):
-                                    name = item.get('name')
-                                    if not name and isinstance(item.get('item'), dict):
-                                        name = item['item'].get('name')
-                                    
-                                    if name and isinstance(name, str) and len(name) > 1:
-                                        clean_name = name.strip()
-                                        if (clean_name.lower() not in {'savers', 'home', 'homepage'} and
-                                            not clean_name.lower().startswith(('back to', 'shop', 'browse'))):
-                                            breadcrumbs.append(clean_name)
-                            
-                            if breadcrumbs and len(breadcrumbs) <= 6:
-                                return breadcrumbs, "savers_json_ld_6level"
+        for obj in _jsonld_objects(soup, tree, _SAVERS_JSONLD_MARKERS):
+            if isinstance(obj, dict) and obj.get('@type') == 'BreadcrumbList':
+                items = obj.get('itemListElement', [])
+                breadcrumbs = []
                 
-                except json.JSONDecodeError:
-                    continue
+                sorted_items = sorted(items, key=_safe_position)
+                
+                for item in sorted_items:
+                    if isinstance(item, dict):
+                        name = item.get('name')
+                        if not name and isinstance(item.get('item'), dict):
+                            name = item['item'].get('name')
+                        
+                        if name and isinstance(name, str) and len(name) > 1:
+                            clean_name = name.strip()
+                            clean_lower = clean_name.lower()
+                            if (clean_lower not in _SAVERS_JSONLD_SKIP_TERMS and
+                                not clean_lower.startswith(_SAVERS_JSONLD_SKIP_PREFIXES)):
+                                breadcrumbs.append(clean_name)
+                
+                if breadcrumbs and len(breadcrumbs) <= 6:
+                    return breadcrumbs, "savers_json_ld_6level"
     
     except Exception as e:
         logger.debug(f"Savers JSON-LD extraction failed: {e}")
     
     # Method 2: DOM breadcrumb extraction
     try:
-        breadcrumb_selectors = [
-            "nav[aria-label*='breadcrumb'] a",
-            ".breadcrumb a",
-            ".breadcrumbs a",
-            "ol.breadcrumb a",
-            "ul.breadcrumb a",
-            ".category-nav a",
-            ".product-breadcrumb a",
-            ".navigation-breadcrumb a",
-            "[data-testid*='breadcrumb'] a",
-        ]
-        
-        for selector in breadcrumb_selectors:
+        # The breadcrumb selectors run as one union query (a single traversal, results in document
+        # order). Each of their hit lists is a subset of the union's, so when every union hit is
+        # filtered out no single breadcrumb selector could yield a crumb either, and the search
+        # falls through to .category-nav.
+        for selector, selector_xpath in _SAVERS_DOM_QUERIES:
             try:
-                elements = soup.select(selector)
+                elements = selector_xpath(tree) if tree is not None else _css_select(soup, selector)
                 if elements:
                     breadcrumbs = []
                     for elem in elements:
-                        text = elem.get_text(strip=True)
+                        text = _node_text(elem)
+                        text_lower = text.lower()
                         href = elem.get('href', '')
                         
                         if (text and len(text) > 1 and len(text) < 100 and
-                            text.lower() not in {'savers', 'home', 'homepage', 'shop', 'browse'} and
-                            not text.lower().startswith(('back to', 'shop all', 'view all', 'see all')) and
-                            not re.search(r'\b(£|\d+\.\d+|free|save|offer|%|off)\b', text.lower())):
-                            breadcrumbs.append(text)
+                            text_lower not in _SAVERS_DOM_SKIP_TERMS and
+                            not text_lower.startswith(_SAVERS_DOM_SKIP_PREFIXES) and
+                            not _has_price_noise(text_lower, _SAVERS_PRICE_NOISE_LITERALS, _SAVERS_PRICE_NOISE_RE)):
+                            # The same few category names recur on every page: intern them so the
+                            # dedupe set below and downstream dict keys compare by identity first
+                            breadcrumbs.append(sys.intern(text))
                     
                     # Remove duplicates and limit to 6 levels
                     seen = set()
@@ -11399,7 +11892,7 @@ def scrape_savers_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
                     
                     if len(cleaned_breadcrumbs) >= 1:
                         return cleaned_breadcrumbs, f"savers_dom_6level_{len(cleaned_breadcrumbs)}"
-                        
+            
             except Exception as e:
                 logger.debug(f"Savers DOM selector '{selector}' failed: {e}")
                 continue
@@ -11413,6 +11906,75 @@ def scrape_savers_improved(soup: BeautifulSoup, html: str, url: str = "") -> Tup
 # LEVEL 6 ASDA BREADCRUMB PARSER (ADVANCED HIERARCHY SUPPORT)
 # ------------------------------------------------------------------
 
+# Breadcrumb props in ASDA's React component scripts
+_ASDA_REACT_BREADCRUMB_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'breadcrumb["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
+        r'breadcrumbTrail["\']?\s*[:=]\s*\[([^\]]+)\]',
+        r'categoryPath["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
+        r'navigationPath["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
+    )
+]
+
+# Breadcrumb text splitting and candidate filters
+_ASDA_MIXED_SEPARATOR_RE = re.compile(r'\n/?\n|\s*/\s*|\s*>\s*')
+_ASDA_JSONLD_MARKERS = ('BreadcrumbList', 'Product')
+_ASDA_PARSE_SKIP_TERMS = frozenset({
+    'asda', 'home', 'homepage', 'groceries', 'all products',
+    'back', 'view all', 'see all', 'show more', 'browse all',
+    'search', 'account', 'basket', 'checkout', 'help', 'contact'
+})
+_ASDA_PARSE_SKIP_PREFIXES = ('back to', 'shop ', 'browse ', 'view all')
+_ASDA_DOM_SKIP_TERMS = frozenset({
+    'asda', 'home', 'groceries', 'all products', 'homepage',
+    'back', 'view all', 'see all', 'show more', 'browse all',
+    'search', 'my account', 'basket', 'checkout'
+})
+_ASDA_DOM_SKIP_PREFIXES = ('back to', 'shop ', 'browse ')
+_ASDA_JSONLD_SKIP_TERMS = frozenset({'asda', 'home', 'groceries'})
+_ASDA_PRICE_NOISE_RE = re.compile(r'\b(£|\d+\.\d+|free|save|offer|deal|%|off)\b')
+_ASDA_PRICE_NOISE_LITERALS = _SAVERS_PRICE_NOISE_LITERALS + ('deal',)
+_ASDA_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+
+# Level 6 DOM selectors as (CSS, XPath) source pairs. The four leading breadcrumb selectors run as
+# one union query (their hits merged in document order); every later selector stays a separate
+# fallback, tried in the original order, so menu links never get mixed into a real breadcrumb trail.
+_ASDA_LINK_OR_SPAN = '*[self::a or self::span]'
+
+_ASDA_BREADCRUMB_SELECTORS = (
+    # ASDA-specific Level 6 breadcrumb selectors
+    ("nav[data-testid*='breadcrumb'] a, nav[data-testid*='breadcrumb'] span",
+     f"//nav[contains(@data-testid, 'breadcrumb')]//{_ASDA_LINK_OR_SPAN}"),
+    ("[data-component='Breadcrumb'] a, [data-component='Breadcrumb'] span",
+     f"//*[@data-component='Breadcrumb']//{_ASDA_LINK_OR_SPAN}"),
+    (".breadcrumb-container a, .breadcrumb-container span",
+     f"//*[{_css_class('breadcrumb-container')}]//{_ASDA_LINK_OR_SPAN}"),
+    ("[aria-label*='breadcrumb' i] a, [aria-label*='breadcrumb' i] span",
+     f"//*[contains(translate(@aria-label, 'BREADCUM', 'breadcum'), 'breadcrumb')]//{_ASDA_LINK_OR_SPAN}"),
+)
+
+_ASDA_NAVIGATION_SELECTORS = (
+    ("[role='navigation'] a[href*='groceries'], [role='navigation'] span",
+     "//*[@role='navigation']//a[contains(@href, 'groceries')] | //*[@role='navigation']//span"),
+    
+    # Level 6 category navigation
+    (".category-nav a, .category-nav span", f"//*[{_css_class('category-nav')}]//{_ASDA_LINK_OR_SPAN}"),
+    (".product-nav a, .product-nav span", f"//*[{_css_class('product-nav')}]//{_ASDA_LINK_OR_SPAN}"),
+    (".page-nav a, .page-nav span", f"//*[{_css_class('page-nav')}]//{_ASDA_LINK_OR_SPAN}"),
+    
+    # Deep hierarchy selectors
+    ("nav li a, nav li span", f"//nav//li//{_ASDA_LINK_OR_SPAN}"),  # Capture both links and text spans
+    (".nav-breadcrumb a, .nav-breadcrumb span", f"//*[{_css_class('nav-breadcrumb')}]//{_ASDA_LINK_OR_SPAN}"),
+    (".navigation-breadcrumb a, .navigation-breadcrumb span",
+     f"//*[{_css_class('navigation-breadcrumb')}]//{_ASDA_LINK_OR_SPAN}"),
+)
+
+# (CSS selector, precompiled XPath) queries for Method 2, tried in order
+_ASDA_LEVEL6_SELECTORS = (
+    (", ".join(css for css, _ in _ASDA_BREADCRUMB_SELECTORS),
+     _xpath(" | ".join(xpath for _, xpath in _ASDA_BREADCRUMB_SELECTORS))),
+) + tuple((css, _xpath(xpath)) for css, xpath in _ASDA_NAVIGATION_SELECTORS)
+
 def _parse_asda_breadcrumb_text(breadcrumb_text: str) -> List[str]:
     """Parse ASDA breadcrumb text with Level 6 deep hierarchy support.
     
@@ -11429,36 +11991,37 @@ def _parse_asda_breadcrumb_text(breadcrumb_text: str) -> List[str]:
         if not breadcrumb_text or not isinstance(breadcrumb_text, str):
             return []
         
+        # Both newline-based separators need a '\n', so one single-character scan settles
+        # them; the dominant ' > '-joined DOM text then goes straight to a plain split
+        has_newline = '\n' in breadcrumb_text
+        
         # ASDA uses \n/\n as separator in their React breadcrumb components
-        if '\n/\n' in breadcrumb_text:
+        if has_newline and '\n/\n' in breadcrumb_text:
             parts = breadcrumb_text.split('\n/\n')
-        elif '\n' in breadcrumb_text and '/' in breadcrumb_text:
-            # Handle mixed separators
-            parts = re.split(r'\n/?\n|\s*/\s*|\s*>\s*', breadcrumb_text)
+        elif has_newline and '/' in breadcrumb_text:
+            # Handle mixed separators (the only case that needs the regex)
+            parts = _ASDA_MIXED_SEPARATOR_RE.split(breadcrumb_text)
         elif ' > ' in breadcrumb_text:
             parts = breadcrumb_text.split(' > ')
         elif ' / ' in breadcrumb_text:
             parts = breadcrumb_text.split(' / ')
         else:
-            parts = [breadcrumb_text]
+            parts = (breadcrumb_text,)
         
         # Clean and validate each part
         cleaned_parts = []
         for part in parts:
             clean_part = part.strip()
+            part_lower = clean_part.lower()
             
             # Skip empty parts and ASDA-specific noise
             if (clean_part and 
                 len(clean_part) > 1 and 
                 len(clean_part) < 150 and  # Allow longer category names for Level 6
-                clean_part.lower() not in {
-                    'asda', 'home', 'homepage', 'groceries', 'all products',
-                    'back', 'view all', 'see all', 'show more', 'browse all',
-                    'search', 'account', 'basket', 'checkout', 'help', 'contact'
-                } and
-                not clean_part.lower().startswith(('back to', 'shop ', 'browse ', 'view all')) and
-                not re.search(r'\b(£|\d+\.\d+|free|save|offer|deal|%|off)\b', clean_part.lower()) and
-                not re.match(r'^\d+$', clean_part)):
+                part_lower not in _ASDA_PARSE_SKIP_TERMS and
+                not part_lower.startswith(_ASDA_PARSE_SKIP_PREFIXES) and
+                not _has_price_noise(part_lower, _ASDA_PRICE_NOISE_LITERALS, _ASDA_PRICE_NOISE_RE) and
+                not _ASDA_DIGITS_ONLY_RE.match(clean_part)):
                 
                 cleaned_parts.append(clean_part)
         
@@ -11488,24 +12051,22 @@ def enhance_asda_scraper_with_level6(soup: BeautifulSoup, html: str, url: str =
     for deep product hierarchies (up to 6 levels of categories).
     """
     
+    # Shared lxml parse of this page (None -> BeautifulSoup fallback)
+    tree = _lxml_tree(html)
+    
     # Method 1: Level 6 React Component Breadcrumb Extraction
     try:
         # ASDA uses React components with specific data structures
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string and 'breadcrumb' in script.string.lower():
-                script_content = script.string
+        if tree is not None:
+            script_texts = [script.text for script in _XPATH_ALL_SCRIPTS(tree)]
+        else:
+            script_texts = [script.string for script in soup.find_all('script')]
+        for script_content in script_texts:
+            if script_content and 'breadcrumb' in script_content.lower():
                 
                 # Look for breadcrumb data in React component props
-                breadcrumb_patterns = [
-                    r'breadcrumb["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
-                    r'breadcrumbTrail["\']?\s*[:=]\s*\[([^\]]+)\]',
-                    r'categoryPath["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
-                    r'navigationPath["\']?\s*[:=]\s*["\']([^"\';]+)["\'];?',
-                ]
-                
-                for pattern in breadcrumb_patterns:
-                    matches = re.findall(pattern, script_content, re.IGNORECASE)
+                for pattern in _ASDA_REACT_BREADCRUMB_PATTERNS:
+                    matches = pattern.findall(script_content)
                     for match in matches:
                         if isinstance(match, str) and len(match) > 3:
                             parsed_breadcrumbs = _parse_asda_breadcrumb_text(match)
@@ -11518,44 +12079,25 @@ def enhance_asda_scraper_with_level6(soup: BeautifulSoup, html: str, url: str =
     
     # Method 2: Enhanced DOM extraction with Level 6 selectors
     try:
-        level6_selectors = [
-            # ASDA-specific Level 6 breadcrumb selectors
-            "nav[data-testid*='breadcrumb'] a, nav[data-testid*='breadcrumb'] span",
-            "[data-component='Breadcrumb'] a, [data-component='Breadcrumb'] span",
-            ".breadcrumb-container a, .breadcrumb-container span",
-            "[aria-label*='breadcrumb' i] a, [aria-label*='breadcrumb' i] span",
-            "[role='navigation'] a[href*='groceries'], [role='navigation'] span",
-            
-            # Level 6 category navigation
-            ".category-nav a, .category-nav span",
-            ".product-nav a, .product-nav span",
-            ".page-nav a, .page-nav span",
-            
-            # Deep hierarchy selectors
-            "nav li a, nav li span",  # Capture both links and text spans
-            ".nav-breadcrumb a, .nav-breadcrumb span",
-            ".navigation-breadcrumb a, .navigation-breadcrumb span",
-        ]
-        
-        for selector in level6_selectors:
+        for selector, selector_xpath in _ASDA_LEVEL6_SELECTORS:
             try:
-                elements = soup.select(selector)
+                elements = selector_xpath(tree) if tree is not None else _css_select(soup, selector)
                 if elements:
                     breadcrumbs = []
+                    seen = set()
                     for elem in elements:
-                        text = elem.get_text(strip=True)
+                        text = _node_text(elem)
+                        text_lower = text.lower()
                         
                         # Apply Level 6 filtering
                         if (text and len(text) > 1 and len(text) < 150 and
-                            text.lower() not in {
-                                'asda', 'home', 'groceries', 'all products', 'homepage',
-                                'back', 'view all', 'see all', 'show more', 'browse all',
-                                'search', 'my account', 'basket', 'checkout'
-                            } and
-                            not text.lower().startswith(('back to', 'shop ', 'browse ')) and
-                            not re.search(r'\b(£|\d+\.\d+|free|save|offer|deal|%|off)\b', text.lower())):
+                            text_lower not in _ASDA_DOM_SKIP_TERMS and
+                            not text_lower.startswith(_ASDA_DOM_SKIP_PREFIXES) and
+                            not _has_price_noise(text_lower, _ASDA_PRICE_NOISE_LITERALS, _ASDA_PRICE_NOISE_RE)):
                             
-                            if text not in breadcrumbs:
+                            text = sys.intern(text)
+                            if text not in seen:
+                                seen.add(text)
                                 breadcrumbs.append(text)
                     
                     # Process with Level 6 parser
@@ -11575,84 +12117,92 @@ def enhance_asda_scraper_with_level6(soup: BeautifulSoup, html: str, url: str =
     
     # Method 3: JSON-LD with Level 6 support
     try:
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-                    candidates = data if isinstance(data, list) else [data]
+        for obj in _jsonld_objects(soup, tree, _ASDA_JSONLD_MARKERS):
+            if isinstance(obj, dict):
+                # BreadcrumbList with Level 6 support
+                if obj.get('@type') == 'BreadcrumbList':
+                    items = obj.get('itemListElement', [])
+                    breadcrumbs = []
                     
-                    for obj in candidates:
-                        if isinstance(obj, dict):
-                            # BreadcrumbList with Level 6 support
-                            if obj.get('@type') == 'BreadcrumbList':
-                                items = obj.get('itemListElement', [])
-                                breadcrumbs = []
-                                
-                                try:
-                                    sorted_items = sorted(items, key=lambda x: x.get('position', 0))
-                                except:
-                                    sorted_items = items
-                                
-                                for item in sorted_items:
-                                    if isinstance(item, dict):
-                                        name = item.get('name')
-                                        if not name and isinstance(item.get('item'), dict):
-                                            name = item['item'].get('name')
-                                        
-                                        if name and isinstance(name, str):
-                                            clean_name = name.strip()
-                                            if clean_name and clean_name.lower() not in {'asda', 'home', 'groceries'}:
-                                                breadcrumbs.append(clean_name)
-                                
-                                # Support up to 6 levels
-                                if breadcrumbs and len(breadcrumbs) <= 6:
-                                    logger.debug(f"🎯 ASDA Level 6: JSON-LD success: {breadcrumbs}")
-                                    return breadcrumbs, "asda_level6_json_ld_breadcrumb"
+                    sorted_items = sorted(items, key=_safe_position)
+                    
+                    for item in sorted_items:
+                        if isinstance(item, dict):
+                            name = item.get('name')
+                            if not name and isinstance(item.get('item'), dict):
+                                name = item['item'].get('name')
                             
-                            # Product with category hierarchy
-                            elif obj.get('@type') == 'Product':
-                                category = obj.get('category')
-                                if category:
-                                    if isinstance(category, str):
-                                        parsed_breadcrumbs = _parse_asda_breadcrumb_text(category)
-                                        if parsed_breadcrumbs:
-                                            return parsed_breadcrumbs, "asda_level6_json_ld_product_category"
-                                    elif isinstance(category, list) and len(category) <= 6:
-                                        return category[:6], "asda_level6_json_ld_category_list"
-                
-                except json.JSONDecodeError:
-                    continue
+                            if name and isinstance(name, str):
+                                clean_name = name.strip()
+                                if clean_name and clean_name.lower() not in _ASDA_JSONLD_SKIP_TERMS:
+                                    breadcrumbs.append(clean_name)
+                    
+                    # Support up to 6 levels
+                    if breadcrumbs and len(breadcrumbs) <= 6:
+                        logger.debug(f"🎯 ASDA Level 6: JSON-LD success: {breadcrumbs}")
+                        return breadcrumbs, "asda_level6_json_ld_breadcrumb"
+                
+                # Product with category hierarchy
+                elif obj.get('@type') == 'Product':
+                    category = obj.get('category')
+                    if category:
+                        if isinstance(category, str):
+                            parsed_breadcrumbs = _parse_asda_breadcrumb_text(category)
+                            if parsed_breadcrumbs:
+                                return parsed_breadcrumbs, "asda_level6_json_ld_product_category"
+                        elif isinstance(category, list) and len(category) <= 6:
+                            return category[:6], "asda_level6_json_ld_category_list"
     
     except Exception as e:
         logger.debug(f"ASDA Level 6 JSON-LD extraction failed: {e}")
     
     return [], "asda_level6_no_breadcrumbs_found"
 
+# React state keys whose value holds the category trail
+_STATE_BREADCRUMB_KEYS = frozenset({'breadcrumbs', 'categories', 'category', 'hierarchy'})
+_STATE_WALK_DONE = object()
+
 def _extract_from_state_data(state_data):
     """Extract breadcrumbs from React state data"""
     try:
-        def recursive_search(obj, target_keys=['breadcrumbs', 'categories', 'category', 'hierarchy']):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key.lower() in target_keys:
-                        if isinstance(value, list):
-                            return [str(item.get('name', item)) if isinstance(item, dict) else str(item) 
-                                   for item in value if item]
-                        elif isinstance(value, str):
-                            return [value]
-                    elif isinstance(value, (dict, list)):
-                        result = recursive_search(value, target_keys)
-                        if result:
-                            return result
-            elif isinstance(obj, list):
-                for item in obj:
-                    result = recursive_search(item, target_keys)
+        # Depth-first walk over an explicit stack of iterators: same visiting order as a
+        # recursive search, without a Python frame per node or the recursion limit
+        stack = []
+        if isinstance(state_data, dict):
+            stack.append((True, iter(state_data.items())))
+        elif isinstance(state_data, list):
+            stack.append((False, iter(state_data)))
+        
+        while stack:
+            is_dict, entries = stack[-1]
+            entry = next(entries, _STATE_WALK_DONE)
+            if entry is _STATE_WALK_DONE:
+                stack.pop()
+                continue
+            
+            if is_dict:
+                key, node = entry
+                if key.lower() in _STATE_BREADCRUMB_KEYS:
+                    if isinstance(node, list):
+                        result = [str(item.get('name', item)) if isinstance(item, dict) else str(item) 
+                                  for item in node if item]
+                    elif isinstance(node, str):
+                        result = [node]
+                    else:
+                        continue
                     if result:
                         return result
-            return None
-        
-        return recursive_search(state_data)
+                    # An empty trail ends the search of this object; carry on with its siblings
+                    stack.pop()
+                    continue
+            else:
+                node = entry
+            
+            if isinstance(node, dict):
+                stack.append((True, iter(node.items())))
+            elif isinstance(node, list):
+                stack.append((False, iter(node)))
+        return None
     except:
         return None
 
@@ -1,8 +1,45 @@
 import pandas as pd
 import re
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 import os
 
+# Optional: rapidfuzz's C scorer screens whole aisles when a part has no words to index
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Words as the regex engine sees them, so an indexed word lookup never misses a \b-bounded match
+WORD_RE = re.compile(r'\w+')
+
+@lru_cache(maxsize=None)
+def word_pattern(name):
+    """Compiled whole-word pattern for a lowercased ingredient name (cached, as names repeat across rows)."""
+    return re.compile(r'\b' + re.escape(name) + r'\b')
+
+def read_table(path):
+    """Read a table, picking Parquet/Feather by suffix and falling back to Excel."""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == '.parquet':
+        return pd.read_parquet(path)
+    if suffix == '.feather':
+        return pd.read_feather(path)
+    return pd.read_excel(path)
+
+def write_table(df, path):
+    """Write a table as Parquet/Feather by suffix; returns False for Excel paths."""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == '.parquet':
+        df.to_parquet(path, index=False)
+    elif suffix == '.feather':
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        return False
+    return True
+
 def match_ingredients_to_products(ingredient_file, product_file, output_file):
     """
     Match ingredients to products based on Aisle_ID and ingredient name in product name.
@@ -12,9 +49,9 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
     2. Removes text in parentheses before searching
     
     Parameters:
-    - ingredient_file: Path to the ingredient Excel file (grok_spn_aisle.xlsx)
-    - product_file: Path to the product Excel file (output_with_aisle_ids.xlsx)
-    - output_file: Path for the output Excel file
+    - ingredient_file: Path to the ingredient Excel file (grok_spn_aisle.xlsx), or a .parquet/.feather copy
+    - product_file: Path to the product Excel file (output_with_aisle_ids.xlsx), or a .parquet/.feather copy
+    - output_file: Path for the output Excel file (a .parquet/.feather path saves the matched results only)
     """
     
     try:
@@ -23,11 +60,11 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         print("INGREDIENT TO PRODUCT MATCHER")
         print("="*60)
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Reading ingredient file...")
-        ingredients_df = pd.read_excel(ingredient_file)
+        ingredients_df = read_table(ingredient_file)
         print(f"   ✓ Loaded {len(ingredients_df)} ingredients")
         
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Reading product file...")
-        products_df = pd.read_excel(product_file)
+        products_df = read_table(product_file)
         print(f"   ✓ Loaded {len(products_df)} products")
         
         # Validate required columns
@@ -60,11 +97,29 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         
         # Group products by aisle_id for faster lookup
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Optimizing product lookup...")
-        products_by_aisle = products_df.groupby('aisle_id')
-        print(f"   ✓ Products grouped by {len(products_by_aisle)} aisles")
+        # Lowercase product names once; each aisle maps to the positional rows of its products.
+        # Object dtype keeps lower() and the \b regex on Python's Unicode rules even when pandas
+        # backs strings with pyarrow (whose RE2 treats "é" as a non-word character)
+        products_df['_name_lc'] = products_df['product_name'].astype(object).str.lower()
+        aisle_to_idx = products_df.groupby('aisle_id').indices
+        print(f"   ✓ Products grouped by {len(aisle_to_idx)} aisles")
+        
+        # Inverted index: (aisle_id, word) -> positional rows of that aisle's products whose name has the word
+        word_index = defaultdict(set)
+        for row_pos, (product_aisle_id, name_lc) in enumerate(zip(products_df['aisle_id'], products_df['_name_lc'])):
+            if pd.isna(product_aisle_id):
+                continue
+            for word in WORD_RE.findall(name_lc):
+                word_index[(product_aisle_id, word)].add(row_pos)
+        print(f"   ✓ Indexed {len(word_index)} aisle/word pairs")
         
-        # Prepare the output list
-        results = []
+        # Lowercased product names per aisle, built on first use by the word-less fallback
+        aisle_names = {}
+        
+        # Prepare the output columns (one list per column, so the DataFrame is built without per-row dicts)
+        results = {col: [] for col in ['Original_Ingredient', 'Search_Terms_Used', 'Main_Aisle_ID',
+                                       'Secondary_Aisle_ID', 'Match_Count', 'Unique_Stores',
+                                       'Product_Codes', 'Stores', 'Product_Names']}
         total_matches = 0
         ingredients_with_slash = 0
         ingredients_with_parentheses = 0
@@ -98,6 +153,7 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
                 ingredient_parts = [ingredient_cleaned]
             
             matched_products = []
+            seen_keys = set()
             search_terms_used = []
             
             # STEP 3: Search for EACH ingredient part
@@ -108,6 +164,11 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
                 ingredient_name_lower = ingredient_part.lower()
                 search_terms_used.append(ingredient_part)
                 
+                # Check if ingredient name is in product name (partial match, case-insensitive)
+                # Use word boundary to avoid matching "gin" in "ginger" (compiled once per distinct name)
+                pattern = word_pattern(ingredient_name_lower)
+                part_words = set(WORD_RE.findall(ingredient_name_lower))
+                
                 # Use secondary aisle ID as per requirement
                 # If secondary ID doesn't exist, fall back to main ID
                 aisle_ids_to_search = []
@@ -118,31 +179,44 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
                 
                 # Search in the specified aisles for THIS ingredient part
                 for aisle_id in aisle_ids_to_search:
-                    try:
-                        filtered_products = products_by_aisle.get_group(aisle_id)
-                        
-                        # Search for this ingredient part in product names
-                        for _, product_row in filtered_products.iterrows():
-                            product_name_lower = product_row['product_name'].lower()
-                            
-                            # Check if ingredient name is in product name (partial match, case-insensitive)
-                            # Use word boundary to avoid matching "gin" in "ginger"
-                            pattern = r'\b' + re.escape(ingredient_name_lower) + r'\b'
-                            
-                            if re.search(pattern, product_name_lower):
-                                # Check if this product is already matched (to avoid duplicates)
-                                product_key = (product_row['product_code'], product_row['store'])
-                                if not any(p['product_code'] == product_row['product_code'] and 
-                                         p['store'] == product_row['store'] for p in matched_products):
-                                    matched_products.append({
-                                        'product_code': product_row['product_code'],
-                                        'product_name': product_row['product_name'],
-                                        'store': product_row['store']
-                                    })
-                                
-                    except KeyError:
+                    aisle_idx = aisle_to_idx.get(aisle_id)
+                    if aisle_idx is None:
                         # No products found for this aisle_id
-                        pass
+                        continue
+                    
+                    # Any word-boundary match contains every word of the part, so intersecting the
+                    # per-word row sets (smallest first) leaves only a handful of rows for the regex
+                    if part_words:
+                        row_sets = sorted((word_index.get((aisle_id, word), set()) for word in part_words), key=len)
+                        candidate_rows = sorted(row_sets[0].intersection(*row_sets[1:]))
+                    else:
+                        candidate_rows = aisle_idx
+                        if RAPIDFUZZ_AVAILABLE:
+                            # Every name containing the part scores 100, so the cutoff only drops non-matches
+                            if aisle_id not in aisle_names:
+                                aisle_names[aisle_id] = products_df['_name_lc'].values[aisle_idx].tolist()
+                            # processor=None: rapidfuzz 2.x defaults to default_process, which strips
+                            # the non-word characters these parts consist of
+                            fuzzy_hits = fuzz_process.extract(ingredient_name_lower, aisle_names[aisle_id],
+                                                              scorer=fuzz.partial_ratio, processor=None,
+                                                              score_cutoff=100, limit=None)
+                            candidate_rows = aisle_idx[sorted(choice_idx for _, _, choice_idx in fuzzy_hits)]
+                    if len(candidate_rows) == 0:
+                        continue
+                    
+                    candidates = products_df.iloc[candidate_rows]
+                    hits = candidates[candidates['_name_lc'].str.contains(pattern)]
+                    
+                    for product_code, product_name, store in zip(hits['product_code'], hits['product_name'], hits['store']):
+                        # Check if this product is already matched (to avoid duplicates)
+                        key = (product_code, store)
+                        if key not in seen_keys:
+                            seen_keys.add(key)
+                            matched_products.append({
+                                'product_code': product_code,
+                                'product_name': product_name,
+                                'store': store
+                            })
             
             # Create result entry
             match_count = len(matched_products)
@@ -159,31 +233,22 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
                 
                 # Get unique stores
                 unique_stores = ', '.join(sorted(set([p['store'] for p in matched_products])))
-                
-                results.append({
-                    'Original_Ingredient': original_ingredient_name,
-                    'Search_Terms_Used': search_terms_str,
-                    'Main_Aisle_ID': main_id,
-                    'Secondary_Aisle_ID': secondary_id,
-                    'Match_Count': match_count,
-                    'Unique_Stores': unique_stores,
-                    'Product_Codes': product_codes,
-                    'Stores': stores,
-                    'Product_Names': product_names
-                })
             else:
                 # No matches found
-                results.append({
-                    'Original_Ingredient': original_ingredient_name,
-                    'Search_Terms_Used': search_terms_str,
-                    'Main_Aisle_ID': main_id,
-                    'Secondary_Aisle_ID': secondary_id,
-                    'Match_Count': 0,
-                    'Unique_Stores': '',
-                    'Product_Codes': 'No matches found',
-                    'Stores': '',
-                    'Product_Names': 'No matches found'
-                })
+                unique_stores = ''
+                product_codes = 'No matches found'
+                stores = ''
+                product_names = 'No matches found'
+            
+            results['Original_Ingredient'].append(original_ingredient_name)
+            results['Search_Terms_Used'].append(search_terms_str)
+            results['Main_Aisle_ID'].append(main_id)
+            results['Secondary_Aisle_ID'].append(secondary_id)
+            results['Match_Count'].append(match_count)
+            results['Unique_Stores'].append(unique_stores)
+            results['Product_Codes'].append(product_codes)
+            results['Stores'].append(stores)
+            results['Product_Names'].append(product_names)
             
             # Progress indicator
             if (idx + 1) % 100 == 0 or (idx + 1) == len(ingredients_df):
@@ -198,53 +263,55 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         # Sort by match count (descending) and then by ingredient name
         output_df = output_df.sort_values(['Match_Count', 'Original_Ingredient'], ascending=[False, True])
         
-        # Save to Excel with formatting
+        # Save results (Excel report with formatting by default)
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Saving results to {output_file}...")
         
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            # Main results
-            output_df.to_excel(writer, sheet_name='Matched Results', index=False)
+        # Intermediate runs can skip the multi-sheet Excel report and keep a typed Parquet/Feather table
+        if not write_table(output_df, output_file):
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                # Main results
+                output_df.to_excel(writer, sheet_name='Matched Results', index=False)
             
-            # Summary statistics
-            summary_data = {
-                'Metric': [
-                    'Total Ingredients Processed',
-                    'Ingredients with "/" (Slash)',
-                    'Ingredients with "()" (Parentheses)',
-                    'Ingredients with Matches',
-                    'Ingredients without Matches',
-                    'Total Product Matches Found',
-                    'Average Matches per Ingredient',
-                    'Match Rate (%)',
-                    'Processing Date'
-                ],
-                'Value': [
-                    len(ingredients_df),
-                    ingredients_with_slash,
-                    ingredients_with_parentheses,
-                    len(output_df[output_df['Match_Count'] > 0]),
-                    len(output_df[output_df['Match_Count'] == 0]),
-                    output_df['Match_Count'].sum(),
-                    f"{output_df['Match_Count'].mean():.2f}",
-                    f"{(len(output_df[output_df['Match_Count'] > 0]) / len(ingredients_df) * 100):.1f}%",
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                # Summary statistics
+                summary_data = {
+                    'Metric': [
+                        'Total Ingredients Processed',
+                        'Ingredients with "/" (Slash)',
+                        'Ingredients with "()" (Parentheses)',
+                        'Ingredients with Matches',
+                        'Ingredients without Matches',
+                        'Total Product Matches Found',
+                        'Average Matches per Ingredient',
+                        'Match Rate (%)',
+                        'Processing Date'
+                    ],
+                    'Value': [
+                        len(ingredients_df),
+                        ingredients_with_slash,
+                        ingredients_with_parentheses,
+                        len(output_df[output_df['Match_Count'] > 0]),
+                        len(output_df[output_df['Match_Count'] == 0]),
+                        output_df['Match_Count'].sum(),
+                        f"{output_df['Match_Count'].mean():.2f}",
+                        f"{(len(output_df[output_df['Match_Count'] > 0]) / len(ingredients_df) * 100):.1f}%",
+                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    ]
+                }
+                summary_df = pd.DataFrame(summary_data)
+                summary_df.to_excel(writer, sheet_name='Summary', index=False)
             
-            # Top matched ingredients
-            top_matches = output_df[output_df['Match_Count'] > 0].head(20)[['Original_Ingredient', 'Search_Terms_Used', 'Match_Count', 'Unique_Stores']]
-            top_matches.to_excel(writer, sheet_name='Top 20 Matches', index=False)
+                # Top matched ingredients
+                top_matches = output_df[output_df['Match_Count'] > 0].head(20)[['Original_Ingredient', 'Search_Terms_Used', 'Match_Count', 'Unique_Stores']]
+                top_matches.to_excel(writer, sheet_name='Top 20 Matches', index=False)
             
-            # Unmatched ingredients
-            unmatched = output_df[output_df['Match_Count'] == 0][['Original_Ingredient', 'Search_Terms_Used', 'Main_Aisle_ID', 'Secondary_Aisle_ID']]
-            unmatched.to_excel(writer, sheet_name='Unmatched Ingredients', index=False)
+                # Unmatched ingredients
+                unmatched = output_df[output_df['Match_Count'] == 0][['Original_Ingredient', 'Search_Terms_Used', 'Main_Aisle_ID', 'Secondary_Aisle_ID']]
+                unmatched.to_excel(writer, sheet_name='Unmatched Ingredients', index=False)
             
-            # Ingredients with slashes (for review)
-            slash_ingredients = output_df[output_df['Search_Terms_Used'].str.contains(' OR ')][['Original_Ingredient', 'Search_Terms_Used', 'Match_Count', 'Unique_Stores']]
-            if len(slash_ingredients) > 0:
-                slash_ingredients.to_excel(writer, sheet_name='Slash Ingredients', index=False)
+                # Ingredients with slashes (for review)
+                slash_ingredients = output_df[output_df['Search_Terms_Used'].str.contains(' OR ')][['Original_Ingredient', 'Search_Terms_Used', 'Match_Count', 'Unique_Stores']]
+                if len(slash_ingredients) > 0:
+                    slash_ingredients.to_excel(writer, sheet_name='Slash Ingredients', index=False)
             
         print(f"   ✓ Results saved successfully!")
         
@@ -1,7 +1,258 @@
+import numpy as np
 import pandas as pd
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import os
+from openpyxl import Workbook
+
+# Optional: python-calamine (Rust) parses .xlsx input much faster than openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_READ_ENGINE = 'openpyxl'
+
+# Optional: pyahocorasick scans each aisle once for all of its ingredients
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: DuckDB runs the aisle join and substring filter as one columnar query
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+# Optional: Polars runs the same join and filter as a lazy query when DuckDB is not installed
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Optional: numba compiles the per-ingredient product scan over a flat byte buffer
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many products, starting worker processes costs more than the per-aisle scans save
+PARALLEL_MIN_PRODUCTS = 20000
+
+# The DuckDB/Polars matchers pair every product of an aisle with every ingredient of that aisle
+# before filtering, so their memory grows with products x ingredients. Aisles are grouped into
+# separate queries holding at most this many pairs (a larger single aisle gets a query of its own)
+JOIN_MAX_PAIRS = 5_000_000
+
+@lru_cache(maxsize=None)
+def word_pattern(name):
+    """Compiled whole-word pattern for a lowercased ingredient name (cached, as names repeat across rows)."""
+    return re.compile(r'\b' + re.escape(name) + r'\b')
+
+def is_word_char(char):
+    """Same character class as the regex \\w on str patterns."""
+    return char.isalnum() or char == '_'
+
+def has_word(haystack, needle):
+    """
+    True when needle occurs in haystack with a word boundary on both sides.
+    
+    Gives the same answer as word_pattern(needle).search(haystack), using str.find plus a
+    look at the two neighbouring characters instead of running the regex engine.
+    """
+    pos = haystack.find(needle)
+    if pos == -1:
+        return False
+    size = len(needle)
+    end = len(haystack)
+    first_is_word = is_word_char(needle[0])
+    last_is_word = is_word_char(needle[-1])
+    while pos != -1:
+        # \b holds where word-ness changes; outside the string counts as non-word
+        before_is_word = pos > 0 and is_word_char(haystack[pos - 1])
+        after_is_word = pos + size < end and is_word_char(haystack[pos + size])
+        if before_is_word != first_is_word and after_is_word != last_is_word:
+            return True
+        pos = haystack.find(needle, pos + 1)
+    return False
+
+def match_aisle_products(product_names_lc, ingredient_names):
+    """
+    Scan an aisle's lowercased product names once for every ingredient mapped to that aisle.
+    
+    An Aho-Corasick automaton finds every ingredient occurring as a substring in a single pass
+    per product; has_word then confirms the word boundaries for only those (ingredient, product) pairs.
+    
+    Returns a dict of ingredient name -> positions (in aisle order) of its matching products.
+    """
+    automaton = ahocorasick.Automaton()
+    for name in ingredient_names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    
+    matches = {name: [] for name in ingredient_names}
+    for pos, product_name in enumerate(product_names_lc):
+        for name in {found for _, found in automaton.iter(product_name)}:
+            if has_word(product_name, name):
+                matches[name].append(pos)
+    return matches
+
+def aisle_job_batches(aisle_jobs):
+    """Split aisle job indices into consecutive batches of at most JOIN_MAX_PAIRS (product, ingredient) pairs."""
+    batch, batch_pairs = [], 0
+    for job, (_, aisle_names_lc, ingredient_names) in enumerate(aisle_jobs):
+        pairs = len(aisle_names_lc) * len(ingredient_names)
+        if batch and batch_pairs + pairs > JOIN_MAX_PAIRS:
+            yield batch
+            batch, batch_pairs = [], 0
+        batch.append(job)
+        batch_pairs += pairs
+    if batch:
+        yield batch
+
+def aisle_job_frames(aisle_jobs, jobs):
+    """
+    Flatten the given aisle jobs into a products frame (job, pos, name_lc) and an ingredients frame (job, name).
+    
+    Jobs are keyed by their list index, which sidesteps mixed int/float aisle ids in the join.
+    """
+    products = pd.DataFrame(
+        [(job, pos, name) for job in jobs for pos, name in enumerate(aisle_jobs[job][1])],
+        columns=['job', 'pos', 'name_lc'])
+    ingredients = pd.DataFrame(
+        [(job, name) for job in jobs for name in aisle_jobs[job][2]],
+        columns=['job', 'name'])
+    return products, ingredients
+
+def confirm_candidates(aisle_jobs, candidate_batches):
+    """
+    Keep the (job, name, pos, name_lc) substring candidates that has_word confirms as whole-word matches.
+    
+    Each batch must be ordered by position within each (job, name) so positions stay in aisle order.
+    Returns a dict of aisle_id -> {ingredient name -> positions of its matching products}.
+    """
+    aisle_matches = {aisle_id: {name: [] for name in ingredient_names}
+                     for aisle_id, _, ingredient_names in aisle_jobs}
+    for candidates in candidate_batches:
+        for job, name, pos, product_name in candidates:
+            if has_word(product_name, name):
+                aisle_matches[aisle_jobs[job][0]][name].append(pos)
+    return aisle_matches
+
+def match_aisles_duckdb(aisle_jobs):
+    """
+    Match aisle jobs with DuckDB joins on aisle with a substring condition, one query per batch of aisles.
+    
+    DuckDB's regex engine treats \\b as ASCII-only, so the query only narrows the
+    (ingredient, product) pairs with contains(); has_word then applies the exact boundary check.
+    """
+    def batch_candidates(con):
+        for jobs in aisle_job_batches(aisle_jobs):
+            products, ingredients = aisle_job_frames(aisle_jobs, jobs)
+            con.register('prod', products)
+            con.register('ing', ingredients)
+            yield con.execute(
+                "SELECT i.job, i.name, p.pos, p.name_lc FROM ing i JOIN prod p "
+                "ON i.job = p.job AND contains(p.name_lc, i.name) ORDER BY i.job, i.name, p.pos"
+            ).fetchall()
+    
+    con = duckdb.connect()
+    try:
+        return confirm_candidates(aisle_jobs, batch_candidates(con))
+    finally:
+        con.close()
+
+def match_aisles_polars(aisle_jobs):
+    """
+    Match aisle jobs with lazy Polars joins on aisle filtered by literal substring containment,
+    one query per batch of aisles.
+    
+    The literal contains() only narrows the candidates to substring hits; has_word is still needed
+    to confirm word boundaries, since a substring hit says nothing about the characters around it.
+    """
+    def batch_candidates():
+        for jobs in aisle_job_batches(aisle_jobs):
+            products, ingredients = aisle_job_frames(aisle_jobs, jobs)
+            yield (
+                pl.from_pandas(ingredients).lazy()
+                .join(pl.from_pandas(products).lazy(), on='job')
+                .filter(pl.col('name_lc').str.contains(pl.col('name'), literal=True))
+                .sort(['job', 'name', 'pos'])
+                .collect()
+                .iter_rows()
+            )
+    
+    return confirm_candidates(aisle_jobs, batch_candidates())
+
+def build_name_buffer(product_names_lc):
+    """
+    Pack lowercased product names into one uint8 buffer with per-name start/end offsets.
+    
+    Only ASCII names are packed (non-ASCII names get an empty span), because a byte-level
+    word-boundary test agrees with Python's Unicode \\b only for ASCII text.
+    """
+    is_ascii = np.fromiter((name.isascii() for name in product_names_lc), dtype=np.bool_, count=len(product_names_lc))
+    encoded = [name.encode('ascii') if ascii_name else b'' for name, ascii_name in zip(product_names_lc, is_ascii)]
+    lengths = np.fromiter((len(name) for name in encoded), dtype=np.int64, count=len(encoded))
+    ends = np.cumsum(lengths)
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), ends - lengths, ends, is_ascii
+
+if NUMBA_AVAILABLE:
+    @njit
+    def _is_word_byte(c):
+        return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95
+    
+    @njit(parallel=True)
+    def _find_word_matches(buf, starts, ends, rows, needle, out):
+        # out[k] = True when needle occurs in name rows[k] with a regex \b on both sides
+        n = needle.shape[0]
+        first_is_word = _is_word_byte(needle[0])
+        last_is_word = _is_word_byte(needle[n - 1])
+        for k in prange(rows.shape[0]):
+            start = starts[rows[k]]
+            end = ends[rows[k]]
+            i = start
+            while i + n <= end:
+                j = 0
+                while j < n and buf[i + j] == needle[j]:
+                    j += 1
+                if j == n:
+                    before_is_word = i > start and _is_word_byte(buf[i - 1])
+                    after_is_word = i + n < end and _is_word_byte(buf[i + n])
+                    if before_is_word != first_is_word and after_is_word != last_is_word:
+                        out[k] = True
+                        break
+                i += 1
+
+def word_match_mask(name_buffer, positions, ingredient_name, pattern, aisle_names_lc):
+    """
+    Boolean mask over an aisle's products (given by their positions) whose name contains the
+    ASCII ingredient as a whole word: ASCII names go through the numba scan, the rest through the regex.
+    """
+    buf, starts, ends, is_ascii = name_buffer
+    ascii_rows = is_ascii[positions]
+    mask = np.zeros(len(positions), dtype=np.bool_)
+    found = np.zeros(int(ascii_rows.sum()), dtype=np.bool_)
+    needle = np.frombuffer(ingredient_name.encode('ascii'), dtype=np.uint8)
+    _find_word_matches(buf, starts, ends, positions[ascii_rows], needle, found)
+    mask[ascii_rows] = found
+    if not ascii_rows.all():
+        mask[~ascii_rows] = aisle_names_lc[~ascii_rows].str.contains(pattern).to_numpy(dtype=bool)
+    return mask
+
+def write_sheet(workbook, sheet_name, df):
+    """Append a DataFrame (header + rows, no index) to a write-only workbook as a new sheet."""
+    worksheet = workbook.create_sheet(sheet_name)
+    worksheet.append([str(col) for col in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        # Blank cells for missing values, as to_excel writes them
+        worksheet.append([None if pd.isna(value) else value for value in row])
 
 def match_ingredients_to_products(ingredient_file, product_file, output_file):
     """
@@ -19,11 +270,11 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         print("INGREDIENT TO PRODUCT MATCHER")
         print("="*60)
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Reading ingredient file...")
-        ingredients_df = pd.read_excel(ingredient_file)
+        ingredients_df = pd.read_excel(ingredient_file, engine=EXCEL_READ_ENGINE)
         print(f"   ✓ Loaded {len(ingredients_df)} ingredients")
         
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Reading product file...")
-        products_df = pd.read_excel(product_file)
+        products_df = pd.read_excel(product_file, engine=EXCEL_READ_ENGINE)
         print(f"   ✓ Loaded {len(products_df)} products")
         
         # Validate required columns
@@ -48,94 +299,137 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         ingredients_df['Ingredient'] = ingredients_df['Ingredient'].fillna('').astype(str).str.strip()
         products_df['product_name'] = products_df['product_name'].fillna('').astype(str).str.strip()
         products_df['product_code'] = products_df['product_code'].fillna('').astype(str)
-        products_df['store'] = products_df['store'].fillna('').astype(str)
+        # Few distinct stores and aisles: categorical codes shrink both columns and speed up the groupby
+        products_df['store'] = products_df['store'].fillna('').astype(str).astype('category')
+        products_df['aisle_id'] = products_df['aisle_id'].astype('category')
+        # Lowercase every product name once instead of once per (ingredient, product) pair.
+        # Object dtype keeps lower() and the \b regex on Python's Unicode rules even when pandas
+        # backs strings with pyarrow (whose RE2 treats "é" as a non-word character)
+        products_df['_name_lc'] = products_df['product_name'].astype(object).str.lower()
         
         # Remove empty ingredients
         ingredients_df = ingredients_df[ingredients_df['Ingredient'] != '']
+        # Lowercased ingredient names, shared by the per-aisle matchers and the per-ingredient loop
+        ingredients_df = ingredients_df.assign(_name_lc=ingredients_df['Ingredient'].astype(object).str.lower().str.strip())
         print(f"   ✓ Data cleaned")
         
         # Group products by aisle_id for faster lookup
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Optimizing product lookup...")
-        products_by_aisle = products_df.groupby('aisle_id')
-        print(f"   ✓ Products grouped by {len(products_by_aisle)} aisles")
+        # Each aisle maps to the positional rows of its products (a plain dict lookup per ingredient)
+        aisle_positions = products_df.groupby('aisle_id', observed=True).indices
+        print(f"   ✓ Products grouped by {len(aisle_positions)} aisles")
         
-        # Prepare the output list
-        results = []
+        # Packed names for the numba scan, built on first use: aisles already covered by
+        # aisle_matches below never reach that scan
+        name_buffer = None
+        
+        # Match every aisle's ingredients in one pass over its products
+        aisle_matches = {}
+        if AHOCORASICK_AVAILABLE or DUCKDB_AVAILABLE or POLARS_AVAILABLE:
+            ingredients_by_aisle = {}
+            for ingredient_name, aisle_id in zip(ingredients_df['_name_lc'], ingredients_df['Aisle_ID']):
+                if ingredient_name:
+                    ingredients_by_aisle.setdefault(aisle_id, set()).add(ingredient_name)
+            
+            # One job per aisle that has products: (aisle_id, its product names, its ingredient names)
+            names_lc = products_df['_name_lc'].to_numpy()
+            aisle_jobs = [(aisle_id, names_lc[aisle_positions[aisle_id]].tolist(), ingredient_names)
+                          for aisle_id, ingredient_names in ingredients_by_aisle.items()
+                          if aisle_id in aisle_positions]
+            
+            # Aisles are independent, so large runs spread them over worker processes
+            workers = min(os.cpu_count() or 1, len(aisle_jobs))
+            if not AHOCORASICK_AVAILABLE:
+                matcher = match_aisles_duckdb if DUCKDB_AVAILABLE else match_aisles_polars
+                aisle_matches = matcher(aisle_jobs)
+            elif workers > 1 and len(products_df) >= PARALLEL_MIN_PRODUCTS:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    aisle_results = executor.map(match_aisle_products,
+                                                 [job[1] for job in aisle_jobs], [job[2] for job in aisle_jobs])
+                    aisle_matches = dict(zip([job[0] for job in aisle_jobs], aisle_results))
+            else:
+                for aisle_id, aisle_names_lc, ingredient_names in aisle_jobs:
+                    aisle_matches[aisle_id] = match_aisle_products(aisle_names_lc, ingredient_names)
+            engine = 'Aho-Corasick' if AHOCORASICK_AVAILABLE else 'DuckDB' if DUCKDB_AVAILABLE else 'Polars'
+            print(f"   ✓ Matched ingredients across {len(aisle_matches)} aisles with {engine}")
+        
+        # Prepare the output columns (one list per column, so the DataFrame is built without per-row dicts)
+        results = {col: [] for col in ['Ingredient', 'Aisle_Name', 'Aisle_ID', 'Match_Count',
+                                       'Unique_Stores', 'Product_Codes', 'Stores', 'Product_Names']}
         total_matches = 0
         
         # Iterate through each ingredient
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Matching ingredients to products...")
         print("-" * 60)
         
-        for idx, ingredient_row in ingredients_df.iterrows():
-            ingredient_name = ingredient_row['Ingredient'].lower().strip()
-            aisle_id = ingredient_row['Aisle_ID']
-            aisle_name = ingredient_row['BC2']  # This is the aisle name column
+        # Walk the columns directly instead of boxing every row into a Series
+        for idx, ingredient, ingredient_name, aisle_id, aisle_name in zip(ingredients_df.index, ingredients_df['Ingredient'],
+                                                                         ingredients_df['_name_lc'],
+                                                                         ingredients_df['Aisle_ID'],
+                                                                         ingredients_df['BC2']):  # BC2 is the aisle name column
             
             # Skip if ingredient name is empty
             if not ingredient_name:
                 continue
             
-            matched_products = []
+            # Matched products' columns, read straight off the matching rows
+            code_list, name_list, store_list = [], [], []
             
-            # Get products for this aisle_id
-            try:
-                filtered_products = products_by_aisle.get_group(aisle_id)
+            # Get products for this aisle_id (None when the aisle has no products or aisle_id is missing)
+            aisle_rows = aisle_positions.get(aisle_id)
+            if aisle_rows is None:
+                hits = None
+            elif aisle_id in aisle_matches:
+                match_positions = aisle_matches[aisle_id][ingredient_name]
+                hits = products_df.iloc[aisle_rows[match_positions]] if match_positions else None
+            else:
+                filtered_products = products_df.iloc[aisle_rows]
+                # Check if ingredient name is in product name (partial match, case-insensitive)
+                # Use word boundary to avoid matching "gin" in "ginger"
+                pattern = word_pattern(ingredient_name)
                 
-                # Vectorized matching for better performance
-                for _, product_row in filtered_products.iterrows():
-                    product_name_lower = product_row['product_name'].lower()
-                    
-                    # Check if ingredient name is in product name (partial match, case-insensitive)
-                    # Use word boundary to avoid matching "gin" in "ginger"
-                    pattern = r'\b' + re.escape(ingredient_name) + r'\b'
-                    
-                    if re.search(pattern, product_name_lower):
-                        matched_products.append({
-                            'product_code': product_row['product_code'],
-                            'product_name': product_row['product_name'],
-                            'store': product_row['store']
-                        })
-                        
-            except KeyError:
-                # No products found for this aisle_id
-                pass
+                if NUMBA_AVAILABLE and ingredient_name.isascii():
+                    if name_buffer is None:
+                        name_buffer = build_name_buffer(products_df['_name_lc'].tolist())
+                    # Compiled byte scan over the aisle's names (positions follow the group's row order)
+                    hits = filtered_products[word_match_mask(name_buffer, aisle_rows, ingredient_name,
+                                                             pattern, filtered_products['_name_lc'])]
+                else:
+                    # Vectorized matching: one scan over all product names in this aisle
+                    hits = filtered_products[filtered_products['_name_lc'].str.contains(pattern)]
+            
+            if hits is not None:
+                code_list = hits['product_code'].tolist()
+                name_list = hits['product_name'].tolist()
+                store_list = hits['store'].tolist()
             
             # Create result entry
-            match_count = len(matched_products)
+            match_count = len(code_list)
             total_matches += match_count
             
-            if matched_products:
+            if match_count:
                 # Separate by store
-                product_codes = ' | '.join([f"{p['product_code']}" for p in matched_products])
-                product_names = ' | '.join([p['product_name'] for p in matched_products])
-                stores = ' | '.join([p['store'] for p in matched_products])
+                product_codes = ' | '.join(code_list)
+                product_names = ' | '.join(name_list)
+                stores = ' | '.join(store_list)
                 
                 # Get unique stores
-                unique_stores = ', '.join(sorted(set([p['store'] for p in matched_products])))
-                
-                results.append({
-                    'Ingredient': ingredient_row['Ingredient'],
-                    'Aisle_Name': aisle_name,
-                    'Aisle_ID': aisle_id,
-                    'Match_Count': match_count,
-                    'Unique_Stores': unique_stores,
-                    'Product_Codes': product_codes,
-                    'Stores': stores,
-                    'Product_Names': product_names
-                })
+                unique_stores = ', '.join(sorted(set(store_list)))
             else:
                 # No matches found
-                results.append({
-                    'Ingredient': ingredient_row['Ingredient'],
-                    'Aisle_Name': aisle_name,
-                    'Aisle_ID': aisle_id,
-                    'Match_Count': 0,
-                    'Unique_Stores': '',
-                    'Product_Codes': 'No matches found',
-                    'Stores': '',
-                    'Product_Names': 'No matches found'
-                })
+                unique_stores = ''
+                product_codes = 'No matches found'
+                stores = ''
+                product_names = 'No matches found'
+            
+            results['Ingredient'].append(ingredient)
+            results['Aisle_Name'].append(aisle_name)
+            results['Aisle_ID'].append(aisle_id)
+            results['Match_Count'].append(match_count)
+            results['Unique_Stores'].append(unique_stores)
+            results['Product_Codes'].append(product_codes)
+            results['Stores'].append(stores)
+            results['Product_Names'].append(product_names)
             
             # Progress indicator
             if (idx + 1) % 10 == 0 or (idx + 1) == len(ingredients_df):
@@ -150,41 +444,53 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         # Sort by match count (descending) and then by ingredient name
         output_df = output_df.sort_values(['Match_Count', 'Ingredient'], ascending=[False, True])
         
+        # Match statistics computed once, shared by the report sheets and the console summary
+        matched_df = output_df[output_df['Match_Count'] > 0]
+        matched_count = len(matched_df)
+        unmatched_count = len(output_df) - matched_count  # Match_Count is never negative
+        total_product_matches = output_df['Match_Count'].sum()
+        average_matches = output_df['Match_Count'].mean()
+        match_rate = matched_count / len(ingredients_df) * 100
+        
         # Save to Excel with formatting
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Saving results to {output_file}...")
         
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            # Main results
-            output_df.to_excel(writer, sheet_name='Matched Results', index=False)
-            
-            # Summary statistics
-            summary_data = {
-                'Metric': [
-                    'Total Ingredients Processed',
-                    'Ingredients with Matches',
-                    'Ingredients without Matches',
-                    'Total Product Matches Found',
-                    'Average Matches per Ingredient',
-                    'Match Rate (%)',
-                    'Processing Date'
-                ],
-                'Value': [
-                    len(ingredients_df),
-                    len(output_df[output_df['Match_Count'] > 0]),
-                    len(output_df[output_df['Match_Count'] == 0]),
-                    output_df['Match_Count'].sum(),
-                    f"{output_df['Match_Count'].mean():.2f}",
-                    f"{(len(output_df[output_df['Match_Count'] > 0]) / len(ingredients_df) * 100):.1f}%",
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Top matched ingredients
-            top_matches = output_df[output_df['Match_Count'] > 0].head(20)[['Ingredient', 'Match_Count', 'Unique_Stores']]
-            top_matches.to_excel(writer, sheet_name='Top 20 Matches', index=False)
-            
+        # Write-only workbook: rows stream straight to the sheet XML instead of an in-memory cell tree
+        workbook = Workbook(write_only=True)
+        
+        # Main results
+        write_sheet(workbook, 'Matched Results', output_df)
+        
+        # Summary statistics
+        summary_data = {
+            'Metric': [
+                'Total Ingredients Processed',
+                'Ingredients with Matches',
+                'Ingredients without Matches',
+                'Total Product Matches Found',
+                'Average Matches per Ingredient',
+                'Match Rate (%)',
+                'Processing Date'
+            ],
+            'Value': [
+                len(ingredients_df),
+                matched_count,
+                unmatched_count,
+                total_product_matches,
+                f"{average_matches:.2f}",
+                f"{match_rate:.1f}%",
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ]
+        }
+        summary_df = pd.DataFrame(summary_data)
+        write_sheet(workbook, 'Summary', summary_df)
+        
+        # Top matched ingredients
+        top_matches = matched_df.head(20)[['Ingredient', 'Match_Count', 'Unique_Stores']]
+        write_sheet(workbook, 'Top 20 Matches', top_matches)
+        
+        workbook.save(output_file)
+        
         print(f"   ✓ Results saved successfully!")
         
         # Print summary
@@ -192,20 +498,20 @@ def match_ingredients_to_products(ingredient_file, product_file, output_file):
         print("SUMMARY REPORT")
         print("="*60)
         print(f"Total ingredients processed:      {len(ingredients_df)}")
-        print(f"Ingredients with matches:         {len(output_df[output_df['Match_Count'] > 0])}")
-        print(f"Ingredients without matches:      {len(output_df[output_df['Match_Count'] == 0])}")
-        print(f"Total product matches found:      {output_df['Match_Count'].sum()}")
-        print(f"Average matches per ingredient:   {output_df['Match_Count'].mean():.2f}")
-        print(f"Match rate:                       {(len(output_df[output_df['Match_Count'] > 0]) / len(ingredients_df) * 100):.1f}%")
+        print(f"Ingredients with matches:         {matched_count}")
+        print(f"Ingredients without matches:      {unmatched_count}")
+        print(f"Total product matches found:      {total_product_matches}")
+        print(f"Average matches per ingredient:   {average_matches:.2f}")
+        print(f"Match rate:                       {match_rate:.1f}%")
         print(f"\nOutput file:                      {os.path.abspath(output_file)}")
         print("="*60)
         
         # Show top matches
-        if len(output_df[output_df['Match_Count'] > 0]) > 0:
+        if matched_count > 0:
             print("\n" + "="*60)
             print("TOP 10 INGREDIENTS WITH MOST MATCHES")
             print("="*60)
-            top_10 = output_df[output_df['Match_Count'] > 0].head(10)
+            top_10 = matched_df.head(10)
             for _, row in top_10.iterrows():
                 print(f"{row['Ingredient']:30} → {row['Match_Count']} matches ({row['Unique_Stores']})")
             print("="*60)
@@ -1,8 +1,17 @@
 import pandas as pd
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import json
 
+# Faster serialization of the per-row ingredient lists when orjson is installed
+try:
+    import orjson
+    def _json_dumps(obj):
+        # orjson returns bytes, which psycopg2 would send as bytea; jsonb needs text
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
 # 1. Configuration & Paths
 EXCEL_PATH = r"C:\Users\DELL\Desktop\New folder\uk_ingredients_for_updated_extended_ingredients.xlsx"
 
@@ -14,6 +23,16 @@ DB_CONFIG = {
     "port": "5432"
 }
 
+# Rows fetched per server-side round trip, and rows written per batched UPDATE
+BATCH_SIZE = 1000
+
+UPDATE_SQL = """
+    UPDATE ab_api_ingredients AS t
+    SET updated_extended_ingredients = v.data::jsonb
+    FROM (VALUES %s) AS v(id, data)
+    WHERE t.id = v.id
+"""
+
 def process_ingredients():
     # 2. Load Excel Mapping
     try:
@@ -29,8 +48,8 @@ def process_ingredients():
             return
 
         mapping = {
-            str(row[col_key]).strip().lower(): str(row[col_val]).strip()
-            for _, row in df.iterrows()
+            str(key).strip().lower(): str(val).strip()
+            for key, val in zip(df[col_key], df[col_val])
         }
         print(f"Successfully loaded {len(mapping)} ingredient mappings.")
 
@@ -40,22 +59,26 @@ def process_ingredients():
 
     # 3. Database Operations
     conn = None
+    cursor = stream_cursor = None
     try:
         conn = psycopg2.connect(**DB_CONFIG)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
+        # Server-side cursor: rows arrive in batches of itersize instead of all at once
+        stream_cursor = conn.cursor(name='ingr_stream', cursor_factory=RealDictCursor)
+        stream_cursor.itersize = BATCH_SIZE
         
         print("Fetching data...")
-        cursor.execute("""
+        stream_cursor.execute("""
             SELECT id, extended_ingredients 
             FROM ab_api_ingredients 
             WHERE extended_ingredients IS NOT NULL
         """)
-        rows = cursor.fetchall()
         
-        print(f"Processing {len(rows)} rows...")
+        print("Processing rows...")
         updated_count = 0
+        pending = []  # (id, json) pairs not yet written; flushed every BATCH_SIZE rows
 
-        for row in rows:
+        for row in stream_cursor:
             record_id = row['id']
             ingredients = row['extended_ingredients']
             
@@ -77,36 +100,39 @@ def process_ingredients():
                 unit_raw = str(item.get('unit', '')).strip()
                 unit_lower = unit_raw.lower()
                 consistency = str(item.get('consistency', '')).strip().upper()
+                measures = item.get('measures', {})
+                us = measures.get('us')
+                metric = measures.get('metric')
 
                 # 1. Handle Blank Units -> piece
                 if unit_raw == "":
                     item['unit'] = "piece"
                     unit_lower = "piece"
-                    if 'measures' in item:
-                        if 'us' in item['measures']: item['measures']['us']['unitLong'] = "piece"
-                        if 'metric' in item['measures']: item['measures']['metric']['unitLong'] = "piece"
+                    unit_long = "piece"
                 
                 # 2. Handle "pieces" plural
                 elif unit_lower == "pieces":
-                    if 'measures' in item:
-                        if 'us' in item['measures']: item['measures']['us']['unitLong'] = "pieces"
-                        if 'metric' in item['measures']: item['measures']['metric']['unitLong'] = "pieces"
+                    unit_long = "pieces"
 
                 # 3. NEW RULE: piece + SOLID -> unitLong = "piece"
                 elif unit_lower == "piece" and consistency == "SOLID":
-                    if 'measures' in item:
-                        if 'us' in item['measures']: item['measures']['us']['unitLong'] = "piece"
-                        if 'metric' in item['measures']: item['measures']['metric']['unitLong'] = "piece"
+                    unit_long = "piece"
+
+                else:
+                    unit_long = None
+
+                if unit_long is not None:
+                    if us is not None: us['unitLong'] = unit_long
+                    if metric is not None: metric['unitLong'] = unit_long
 
                 # --- C. Consistency & Metric Conversion Logic ---
-                metric_data = item.get('measures', {}).get('metric', {})
-                metric_unit_long = str(metric_data.get('unitLong', '')).strip().lower()
+                metric_unit_long = str(metric.get('unitLong', '')).strip().lower() if metric is not None else ''
 
                 # Rule: Cup(s) + SOLID + Milliliters -> Grams
-                if unit_lower in ['cup', 'cups'] and consistency == 'SOLID':
+                if unit_lower in ('cup', 'cups') and consistency == 'SOLID':
                     if metric_unit_long == 'milliliters':
-                        item['measures']['metric']['unitLong'] = 'grams'
-                        item['measures']['metric']['unitShort'] = 'g'
+                        metric['unitLong'] = 'grams'
+                        metric['unitShort'] = 'g'
                         metric_unit_long = 'grams'
 
                 # Rule: Milliliters + SOLID -> Consistency = LIQUID
@@ -120,17 +146,20 @@ def process_ingredients():
                 
                 new_ingredients_list.append(item)
 
-            # 4. Update the Database
-            cursor.execute("""
-                UPDATE ab_api_ingredients 
-                SET updated_extended_ingredients = %s 
-                WHERE id = %s
-            """, (json.dumps(new_ingredients_list), record_id))
+            pending.append((record_id, _json_dumps(new_ingredients_list)))
+            
+            # 4. Update the Database (one statement per batch of rows instead of one per row)
+            if len(pending) >= BATCH_SIZE:
+                execute_values(cursor, UPDATE_SQL, pending, template="(%s, %s)", page_size=BATCH_SIZE)
+                pending.clear()
             
             updated_count += 1
             if updated_count % 100 == 0:
                 print(f"Progress: {updated_count} rows processed...")
 
+        if pending:
+            execute_values(cursor, UPDATE_SQL, pending, template="(%s, %s)", page_size=BATCH_SIZE)
+
         conn.commit()
         print(f"Finished! Updated {updated_count} records.")
 
@@ -139,8 +168,11 @@ def process_ingredients():
             conn.rollback()
         print(f"Database error: {e}")
     finally:
-        if conn:
+        if stream_cursor is not None:
+            stream_cursor.close()
+        if cursor is not None:
             cursor.close()
+        if conn:
             conn.close()
 
 if __name__ == "__main__":